@@ -27,6 +27,12 @@ from AppKit import (
 )
 
 
+# ClipboardItem.view_variant flags: which optional subviews a popup row for
+# the item needs. Rows are pooled per variant.
+VIEW_HAS_THUMBNAIL = 1
+VIEW_HAS_PHOTO_ICON = 2
+
+
 @dataclass
 class ClipboardItem:
     """A single clipboard history item supporting text and images."""
@@ -35,6 +41,18 @@ class ClipboardItem:
     text_content: Optional[str] = None
     image_data: Optional[bytes] = None  # PNG data for storage
     thumbnail: Optional[object] = field(default=None, repr=False)  # NSImage, excluded from repr
+    view_variant: int = field(default=0, init=False, repr=False, compare=False)  # VIEW_* flags
+    time_str: str = field(default="", init=False, repr=False, compare=False)  # "HH:MM" for the popup row
+    
+    def __post_init__(self):
+        variant = 0
+        if self.image_data is not None and self.thumbnail:
+            variant |= VIEW_HAS_THUMBNAIL
+        if self.content_type == "image":
+            variant |= VIEW_HAS_PHOTO_ICON
+        self.view_variant = variant
+        t = self.timestamp
+        self.time_str = f"{t.hour:02d}:{t.minute:02d}"
     
     @property
     def preview(self) -> str:
@@ -240,6 +258,29 @@ class ClipboardMonitor:
         
         return deleted
     
+    def remove_item(self, item: ClipboardItem) -> bool:
+        """Delete a specific item from history by identity.
+        
+        Safe to call late from another thread: items the poll loop inserted in
+        the meantime don't shift which entry is removed.
+        """
+        deleted = False
+        with self._lock:
+            for i, entry in enumerate(self.history):
+                if entry is item:
+                    del self.history[i]
+                    print(f"[ClipboardMonitor] Deleted item: {item.preview[:30]}...")
+                    deleted = True
+                    break
+            else:
+                print("[ClipboardMonitor] Item to delete is no longer in history")
+        
+        # Save outside of lock to prevent deadlock
+        if deleted:
+            self._save_history()
+        
+        return deleted
+    
     def _poll_loop(self):
         """Background polling loop."""
         print("[ClipboardMonitor] Starting polling loop...")
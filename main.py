@@ -9,6 +9,7 @@ near your cursor when you press Cmd+Option+V.
 import sys
 import signal
 import os
+import logging
 
 class DebugLogger:
     def __init__(self, filename):
@@ -404,7 +405,9 @@ class ClipXDelegate(NSObject):
                 self._popup.hide()
                 return
             
-            # Get clipboard history
+            # Get clipboard history, once deletions from the last showing
+            # have been applied to it
+            self._popup.wait_for_pending_deletions()
             history = self._clipboard_monitor.get_history()
             if not history:
                 print("📭 Clipboard history is empty")
@@ -469,14 +472,14 @@ class ClipXDelegate(NSObject):
         preview = item.content[:30].replace('\n', ' ')
         print(f"✅ Pasted: {preview}...")
     
-    def _on_item_delete(self, index: int):
-        """Called when a clipboard item is deleted via edit mode."""
-        print(f"[Main] _on_item_delete ENTER index={index}", flush=True)
+    def _on_item_delete(self, item):
+        """Called (off the main thread) when a clipboard item is deleted via edit mode."""
+        print(f"[Main] _on_item_delete ENTER item={item.preview[:30]!r}", flush=True)
         try:
             if self._clipboard_monitor:
-                print(f"[Main] Calling delete_item...", flush=True)
-                result = self._clipboard_monitor.delete_item(index)
-                print(f"[Main] delete_item returned: {result}", flush=True)
+                print(f"[Main] Calling remove_item...", flush=True)
+                result = self._clipboard_monitor.remove_item(item)
+                print(f"[Main] remove_item returned: {result}", flush=True)
             print(f"[Main] _on_item_delete EXIT", flush=True)
         except Exception as e:
             print(f"[Main] Error in _on_item_delete: {e}", flush=True)
@@ -510,17 +513,17 @@ class ClipXDelegate(NSObject):
         """Check for updates."""
         print("[Main] User requested update check...")
         
-        # Run in background to avoid blocking UI? 
-        # For simplicity in this iteration, we'll run sync (might block briefly)
-        # or use a simple timer/thread if needed. Since urllib is blocking, 
-        # let's just do it. Ideally dispatch_async.
-        
-        release_info = Updater.check_for_updates()
+        # The lookup runs on NSURLSession's queue; the dialog is shown from
+        # the main-queue callback so the menu bar never freezes
+        Updater.check_for_updates_async(self._on_update_check_finished)
+
+    def _on_update_check_finished(self, release_info):
+        """Show the update dialog - called on main thread."""
         if Updater.show_update_dialog(release_info):
             if release_info:
                 # If install_and_restart returns True, it means the update script is running
                 # and we should terminate to allow it to replace the app file.
-                if Updater.install_and_restart(release_info.get('download_url')):
+                if Updater.install_and_restart(release_info.get('download_url'), release_info.get('sha256')):
                     print("[Main] Update script started. Terminating...")
                     from AppKit import NSApp
                     NSApp.terminate_(self)
@@ -550,6 +553,15 @@ def main():
         # In production, we don't redirect stdout/stderr to a file
         # We can also silence print statements if desired, but just not writing to disk is the main goal
         pass
+    
+    # UI hot paths log through `logging` at DEBUG level; only surface those
+    # messages in dev mode or when CLIPX_DEBUG is set
+    verbose = debug_mode or bool(os.environ.get('CLIPX_DEBUG'))
+    logging.basicConfig(
+        level=logging.DEBUG if verbose else logging.WARNING,
+        format='%(message)s',
+        stream=sys.stdout,
+    )
 
     # Handle Ctrl+C gracefully
     signal.signal(signal.SIGINT, lambda s, f: NSApp.terminate_(None))
@@ -11,6 +11,9 @@ from .constants import (
     ANIMATION_DURATION,
     EDIT_BUTTON_HEIGHT,
     DELETE_BUTTON_SIZE,
+    EDIT_BUTTON_SPACE,
+    MAX_POPUP_ITEMS,
+    ITEM_VIEW_POOL_SIZE,
 )
 from .item_view import ClipboardItemView
 from .edit_button_view import EditButtonView
@@ -26,6 +29,9 @@ __all__ = [
     'ANIMATION_DURATION',
     'EDIT_BUTTON_HEIGHT',
     'DELETE_BUTTON_SIZE',
+    'EDIT_BUTTON_SPACE',
+    'MAX_POPUP_ITEMS',
+    'ITEM_VIEW_POOL_SIZE',
     'ClipboardItemView',
     'EditButtonView',
     'ClipboardPopup',
@@ -1,27 +1,100 @@
 from AppKit import (
     NSAnimationContext,
-    NSTimer,
-    NSMakePoint,
-    NSMakeRect,
-    NSEvent,
+    NSEqualRects,
     NSView,
-    NSColor
+    NSColor,
+    NSOperationQueue,
+    NSValue,
+    NSWindowOcclusionStateVisible
 )
 from Quartz import (
+    CABasicAnimation,
     CAMediaTimingFunction,
+    CATransaction,
+    kCAMediaTimingFunctionEaseIn,
     kCAMediaTimingFunctionEaseOut
 )
+import logging
 import traceback
+import objc
+from collections import deque
+from dataclasses import dataclass
 from typing import List, Optional
 
 from .constants import (
     PADDING, 
     ITEM_HEIGHT, 
     EDIT_BUTTON_HEIGHT, 
+    EDIT_BUTTON_SPACE,
     POPUP_MAX_HEIGHT,
-    POPUP_WIDTH
+    POPUP_WIDTH,
+    MAX_POPUP_ITEMS
 )
 
+logger = logging.getLogger(__name__)
+
+# Ring buffer of recent animation debug messages ("flight recorder").
+# Recording is a cheap deque append; the buffer is only formatted and
+# written out when an animation path hits an error.
+_flight_recorder = deque(maxlen=256)
+
+
+def _trace(msg: str, *args):
+    """Record a debug message for the animation hot path."""
+    _flight_recorder.append((msg, args))
+    logger.debug(msg, *args)
+
+
+def _dump_flight_recorder():
+    """Write the recorded messages to the log, oldest first, and clear the buffer."""
+    for msg, args in _flight_recorder:
+        logger.error(msg, *args)
+    _flight_recorder.clear()
+
+
+# Popup content height and (clamped) window height for n items, indexed by n.
+# Everything but the item count is constant, so the layout math is done once.
+_CONTENT_HEIGHTS = tuple(
+    ITEM_HEIGHT * n + EDIT_BUTTON_SPACE + (PADDING * 3) for n in range(MAX_POPUP_ITEMS + 1)
+)
+_VISIBLE_HEIGHTS = tuple(min(h, POPUP_MAX_HEIGHT) for h in _CONTENT_HEIGHTS)
+
+
+@dataclass(frozen=True)
+class PopupGeometry:
+    """Final popup layout after an item removal, computed once before animating."""
+    __slots__ = ('blur_width', 'content_height', 'edit_x', 'edit_y', 'item_base_y', 'item_width')
+    blur_width: float
+    content_height: float
+    edit_x: float
+    edit_y: float
+    item_base_y: float
+    item_width: float
+
+
+# Total duration of the hide (fade + slide) animation, in seconds
+HIDE_DURATION = 0.12
+
+# Duration of the selection pill's glide between rows, in seconds
+SELECTION_DURATION = 0.15
+
+# Shared timing functions (immutable, so one instance serves every animation)
+_EASE_IN = CAMediaTimingFunction.functionWithName_(kCAMediaTimingFunctionEaseIn)
+_EASE_OUT = CAMediaTimingFunction.functionWithName_(kCAMediaTimingFunctionEaseOut)
+
+
+class _MoveGroupView(NSView):
+    """
+    Transparent group the rows of one offset are moved in during a removal.
+    It spans the whole container, so it only claims clicks that land on one
+    of its rows; anything else falls through to the views below it.
+    """
+    
+    def hitTest_(self, point):
+        hit = objc.super(_MoveGroupView, self).hitTest_(point)
+        return None if hit is self else hit
+
+
 class PopupAnimationMixin:
     """
     Mixin for ClipboardPopup to handle animations.
@@ -29,133 +102,218 @@ class PopupAnimationMixin:
     """
     
     def _init_deletion_queue(self):
-        """Initialize the deletion queue system."""
-        if not hasattr(self, '_deletion_queue'):
-            self._deletion_queue = []  # List of pending deletion requests
-            self._deletion_in_progress = False  # True if an animation is currently running
-            self._pending_deletion_views = set()  # Track views already queued for deletion
+        """Initialize the deletion queue system. Called once from the host's create()."""
+        self._deletion_queue = deque()  # Pending deletion requests, oldest first
+        self._deletion_in_progress = False  # True if an animation is currently running
+        self._pending_deletion_views = set()  # Views already queued for deletion (by identity)
+        self._removing_views = set()  # Views whose removal animation is in flight
     
-    def _queue_item_deletion(self, view_index: int, on_delete_callback=None, item_index: int = None):
+    def _queue_item_deletion(self, view, on_delete_callback=None, item_index: int = None):
         """Queue a complete deletion operation. Processes immediately if no animation is running.
         
-        view_index: The index into _item_views at the time of queueing.
+        view: The item view to delete. It is resolved to its current index only
+            when the request is processed, so queued requests never go stale.
         on_delete_callback: Optional callback to call when processing (e.g., to notify main.py)
         item_index: The original item index for the callback
         """
-        self._init_deletion_queue()
+        # Fast path: nothing animating and nothing queued, so there is nothing
+        # to order against - delete right away without touching the queue.
+        # Invariant: a view only ever reaches the pending set/queue while an
+        # animation is in flight, and views are resolved by identity when
+        # processed, so a repeat request for a view the fast path already
+        # removed is simply skipped later.
+        if not self._deletion_in_progress and not self._deletion_queue:
+            self._animate_item_removal_fast(view, on_delete_callback, item_index)
+            return
         
         # Check if this view is already pending deletion - prevent double-delete
-        if view_index in self._pending_deletion_views:
-            print(f"[Popup] View {view_index} already pending deletion, ignoring", flush=True)
+        if view in self._pending_deletion_views:
+            _trace("[Popup] View %s already pending deletion, ignoring", item_index)
             return
         
         # Mark as pending
-        self._pending_deletion_views.add(view_index)
+        self._pending_deletion_views.add(view)
         
         # Add to queue with all necessary info
         self._deletion_queue.append({
-            'view_index': view_index,
+            'view': view,
             'on_delete_callback': on_delete_callback,
             'item_index': item_index
         })
-        print(f"[Popup] Queued deletion for view index {view_index}, queue size: {len(self._deletion_queue)}", flush=True)
+        _trace("[Popup] Queued deletion for view index %s, queue size: %d", item_index, len(self._deletion_queue))
         
         # If no animation is running, start processing
         if not self._deletion_in_progress:
             self._process_deletion_queue()
     
+    def _deletable_view_at(self, index: int):
+        """The view a delete at `index` (into _item_views) should target.
+        
+        Rows already queued or animating out stay in _item_views (and keep the
+        selection) until their animation ends, so a repeat delete aimed at one
+        of them goes to the next row still present, or the last one before it,
+        as it would once the earlier deletes have been applied. Returns None if
+        every row is already on its way out.
+        """
+        views = self._item_views
+        gone = self._pending_deletion_views | self._removing_views
+        if not gone:
+            return views[index]
+        for view in views[index:]:
+            if view not in gone:
+                return view
+        for view in reversed(views[:index]):
+            if view not in gone:
+                return view
+        return None
+    
     def _process_deletion_queue(self):
         """Process the next item in the deletion queue."""
-        self._init_deletion_queue()
-        
         if not self._deletion_queue:
-            print(f"[Popup] Deletion queue empty, done processing", flush=True)
+            _trace("[Popup] Deletion queue empty, done processing")
             return
         
         if self._deletion_in_progress:
-            print(f"[Popup] Deletion already in progress, waiting...", flush=True)
+            _trace("[Popup] Deletion already in progress, waiting...")
+            return
+        
+        # A backlog built up while the last animation ran: remove it all at once
+        if len(self._deletion_queue) >= 2:
+            self._process_deletion_batch()
             return
         
         # Pop the next deletion request
-        request = self._deletion_queue.pop(0)
-        view_index = request['view_index']
-        
-        # Validate the index is still valid
-        if view_index >= len(self._item_views):
-            print(f"[Popup] View index {view_index} out of bounds (len={len(self._item_views)}), skipping", flush=True)
-            # Remove from pending set
-            self._pending_deletion_views.discard(view_index)
+        request = self._deletion_queue.popleft()
+        view = request['view']
+        self._pending_deletion_views.discard(view)
+        _trace("[Popup] Processing queued deletion, remaining in queue: %d", len(self._deletion_queue))
+        
+        if not self._animate_item_removal_fast(view, request['on_delete_callback'], request['item_index']):
             self._process_deletion_queue()
-            return
+    
+    def _animate_item_removal_fast(self, view, on_delete_callback=None, item_index: int = None) -> bool:
+        """Delete a single view now: notify, drop its item and start the removal animation.
+        
+        Only valid while no other deletion is animating. Returns False if the
+        view is no longer present (e.g. after a rebuild) and nothing was done.
+        """
+        # Resolve the view to its current index; it may be gone after a rebuild
+        try:
+            view_index = self._item_views.index(view)
+        except ValueError:
+            _trace("[Popup] View for item %s no longer present, skipping", item_index)
+            return False
         
         self._deletion_in_progress = True
-        print(f"[Popup] Processing deletion at view index {view_index}, remaining in queue: {len(self._deletion_queue)}", flush=True)
+        _trace("[Popup] Processing deletion at view index %d", view_index)
         
         # Call the delete callback to notify main.py BEFORE modifying data
         # Use the current view_index since data hasn't been modified yet
-        if request['on_delete_callback']:
-            request['on_delete_callback'](view_index)
+        if on_delete_callback:
+            on_delete_callback(view_index)
         
         # Remove from items list NOW (data deletion happens here, in sequence)
         if view_index < len(self._items):
             del self._items[view_index]
         
-        # Adjust all remaining queued indices - items after this one shift down by 1
-        for i in range(len(self._deletion_queue)):
-            if self._deletion_queue[i]['view_index'] > view_index:
-                self._deletion_queue[i]['view_index'] -= 1
-        
-        # Also adjust the pending set
-        new_pending = set()
-        for pending_idx in self._pending_deletion_views:
-            if pending_idx == view_index:
-                continue  # This one is being processed now
-            elif pending_idx > view_index:
-                new_pending.add(pending_idx - 1)
-            else:
-                new_pending.add(pending_idx)
-        self._pending_deletion_views = new_pending
-        
         # Trigger the actual animation
         self._animate_item_removal_queued(view_index)
+        return True
     
-    def _animate_hide(self):
-        """Animate the popup hiding using timer."""
+    def _process_deletion_batch(self):
+        """Drain the whole deletion queue into one batched removal animation."""
+        batch = self._deletion_queue
+        self._deletion_queue = deque()
+        self._pending_deletion_views.clear()
+        _trace("[Popup] Processing %d queued deletions as one batch", len(batch))
+        
+        # Requests are applied in queue order, exactly as one-at-a-time
+        # processing would: each callback sees the index among the items
+        # left after the requests before it.
+        views = self._item_views
+        remaining = list(views)
+        removed_indices = set()
+        for request in batch:
+            view = request['view']
+            try:
+                view_index = remaining.index(view)
+            except ValueError:
+                _trace("[Popup] View for item %s no longer present, skipping", request['item_index'])
+                continue
+            
+            if request['on_delete_callback']:
+                request['on_delete_callback'](view_index)
+            if view_index < len(self._items):
+                del self._items[view_index]
+            remaining.pop(view_index)
+            removed_indices.add(views.index(view))
+        
+        self._deletion_in_progress = True
+        self._animate_batched_removal(removed_indices)
+    
+    def _is_on_screen(self) -> bool:
+        """Whether any part of the popup is currently visible to the user."""
+        return bool(self.isVisible() and (self.occlusionState() & NSWindowOcclusionStateVisible))
+    
+    def _animate_hide(self, completion=None):
+        """Animate the popup hiding (fade + slide down) in one animation group.
+        
+        completion: Optional callable run once the window has been ordered out.
+        """
         if not self._is_visible:
+            if completion is not None:
+                completion()
             return
         self._is_visible = False
         
-        # Remove click monitor if exists
-        if hasattr(self, '_click_monitor') and self._click_monitor:
-            NSEvent.removeMonitor_(self._click_monitor)
-            self._click_monitor = None
+        # Supersede any hide still in flight; only the latest one orders out
+        self._stop_hide_animation()
+        generation = self._hide_generation
         
-        self._hide_step = 0
-        self._hide_steps = 8
-        self._hide_start_y = self.frame().origin.y
-        self._hide_start_alpha = self.alphaValue()
+        origin = self.frame().origin
         
-        def step_animation(timer):
-            self._hide_step += 1
-            progress = self._hide_step / self._hide_steps
-            ease = progress * progress
-            
-            alpha = self._hide_start_alpha * (1 - ease)
-            y = self._hide_start_y - (10 * ease)
-            
-            self.setAlphaValue_(alpha)
-            self.setFrameOrigin_(NSMakePoint(self.frame().origin.x, y))
-            
-            if self._hide_step >= self._hide_steps:
-                timer.invalidate()
-                self.orderOut_(None)
+        NSAnimationContext.beginGrouping()
+        context = NSAnimationContext.currentContext()
+        context.setDuration_(HIDE_DURATION)
+        context.setTimingFunction_(_EASE_IN)
+        
+        def on_hide_complete():
+            # A show (or another hide) since then owns the window now
+            if generation != self._hide_generation:
+                return
+            self.orderOut_(None)
+            if completion is not None:
+                completion()
         
-        NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
-            0.015, True, step_animation
-        )
+        context.setCompletionHandler_(on_hide_complete)
+        self.animator().setAlphaValue_(0.0)
+        self.animator().setFrameOrigin_((origin.x, origin.y - 10))
+        NSAnimationContext.endGrouping()
+    
+    def _stop_hide_animation(self):
+        """Cancel the in-flight hide animation, if any, dropping its completion.
+        The animation group still finishes, but its completion becomes a no-op."""
+        self._hide_generation += 1
 
     def _animate_selection_change(self):
-        """Animate the selection view to the current selected index."""
+        """Animate the selection view to the current selected index.
+        
+        Calls are coalesced: the animation itself runs on the next main-queue
+        turn using whatever the latest selected index is, so a burst of
+        key-repeat moves yields a single animation commit.
+        """
+        if self._selection_coalesce_scheduled:
+            return
+        self._selection_coalesce_scheduled = True
+        
+        def apply_latest_selection():
+            self._selection_coalesce_scheduled = False
+            self._apply_selection_change()
+        
+        NSOperationQueue.mainQueue().addOperationWithBlock_(apply_latest_selection)
+    
+    def _apply_selection_change(self):
+        """Animate the selection view to the current selected index (uncoalesced)."""
         target_frame = None
         
         # Determine target frame
@@ -172,48 +330,112 @@ class PopupAnimationMixin:
             
         self._selection_view.setHidden_(False)
         
-        # Use NSAnimationContext for fluid frame animation (position + size)
-        NSAnimationContext.beginGrouping()
-        NSAnimationContext.currentContext().setDuration_(0.15)
-        # Use easeOut for gliding effect
-        NSAnimationContext.currentContext().setTimingFunction_(
-            CAMediaTimingFunction.functionWithName_(kCAMediaTimingFunctionEaseOut)
-        )
+        # Skip no-op transitions (same key pressed twice, key repeat re-entry).
+        # While an animation is in flight the view's frame is mid-flight, so
+        # compare against the target it is already heading to instead.
+        if self._selection_anim_in_flight:
+            current_target = self._last_selection_frame
+        else:
+            current_target = self._selection_view.frame()
+        if current_target is not None and NSEqualRects(target_frame, current_target):
+            return
+        self._last_selection_frame = target_frame
+        
+        # Not visible to the user - move there without an animation commit
+        if not self._is_on_screen():
+            self._selection_view.setFrame_(target_frame)
+            self._selection_anim_in_flight = False
+            return
         
-        self._selection_view.animator().setFrame_(target_frame)
+        # Glide the pill with explicit layer animations on position (and bounds,
+        # only when the size changes) rather than animating the view's frame:
+        # the view jumps to the target at once and the move is composited.
+        # Each animation starts from the on-screen (presentation) value, so a
+        # new target retargets an in-flight glide without a jump.
+        layer = self._selection_view.layer()
+        shown = layer.presentationLayer() or layer
+        from_position = shown.position()
+        from_bounds = shown.bounds()
         
-        NSAnimationContext.endGrouping()
+        def on_selection_animation_complete():
+            # Only the latest animation clears the flag. A reset (re-show,
+            # rebuild, hide) meanwhile leaves no target and clears it itself.
+            current = self._last_selection_frame
+            if current is not None and NSEqualRects(current, target_frame):
+                self._selection_anim_in_flight = False
+        
+        self._selection_anim_in_flight = True
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
+        CATransaction.setCompletionBlock_(on_selection_animation_complete)
+        self._selection_view.setFrame_(target_frame)
+        
+        position_anim = CABasicAnimation.animationWithKeyPath_("position")
+        position_anim.setFromValue_(NSValue.valueWithPoint_(from_position))
+        position_anim.setToValue_(NSValue.valueWithPoint_(layer.position()))
+        position_anim.setDuration_(SELECTION_DURATION)
+        position_anim.setTimingFunction_(_EASE_OUT)
+        layer.addAnimation_forKey_(position_anim, "position")
+        
+        to_bounds = layer.bounds()
+        if from_bounds.size != to_bounds.size:
+            bounds_anim = CABasicAnimation.animationWithKeyPath_("bounds")
+            bounds_anim.setFromValue_(NSValue.valueWithRect_(from_bounds))
+            bounds_anim.setToValue_(NSValue.valueWithRect_(to_bounds))
+            bounds_anim.setDuration_(SELECTION_DURATION)
+            bounds_anim.setTimingFunction_(_EASE_OUT)
+            layer.addAnimation_forKey_(bounds_anim, "bounds")
+        
+        CATransaction.commit()
 
     def _animate_item_removal(self, removed_index: int):
-        """Animate removal of an item and repositioning of remaining items.
-        This is called directly for the old API. For queue-based deletion, use _queue_item_deletion."""
-        self._init_deletion_queue()
-        
-        # If using the direct API, just run the animation directly
-        self._deletion_in_progress = True
-        self._animate_item_removal_queued(removed_index)
+        """Animate removal of the item at removed_index (0-based into _item_views).
+        Alias for _queue_item_deletion, so it orders with any queued deletions."""
+        if 0 <= removed_index < len(self._item_views):
+            self._queue_item_deletion(self._item_views[removed_index], item_index=removed_index)
     
     def _animate_item_removal_queued(self, removed_index: int):
         """Internal: Animate removal of an item (called from queue processor)."""
         
-        print(f"[Popup] _animate_item_removal_queued called, removed_index={removed_index}, item_views={len(self._item_views)}", flush=True)
+        _trace("[Popup] _animate_item_removal_queued called, removed_index=%d, item_views=%d",
+               removed_index, len(self._item_views))
         
-        if removed_index >= len(self._item_views):
-            print(f"[Popup] removed_index out of bounds, skipping animation", flush=True)
-            return
+        # A single delete is just a batch of one. An out-of-range index is
+        # dropped there, which also clears _deletion_in_progress
+        self._animate_batched_removal((removed_index,))
+    
+    def _animate_batched_removal(self, removed_indices):
+        """Internal: Animate removal of one or more items in a single animation group.
+        
+        removed_indices: Indices into _item_views of the views to remove. The
+        matching entries must already be gone from _items.
+        """
+        _trace("[Popup] _animate_batched_removal called, removed=%s, item_views=%d",
+               sorted(removed_indices), len(self._item_views))
         
         try:
-            removed_view = self._item_views[removed_index]
+            views = self._item_views
+            n_views = len(views)
+            removed_indices = {i for i in removed_indices if i < n_views}
+            if not removed_indices:
+                _trace("[Popup] No removable views in batch, skipping animation")
+                self._deletion_in_progress = False
+                self._process_deletion_queue()
+                return
+            removed_views = [views[i] for i in sorted(removed_indices)]
+            # They stay in _item_views until cleanup; keep new deletes off them
+            self._removing_views.update(removed_views)
+            rebuild_generation = self._rebuild_generation
+            survivors = [v for i, v in enumerate(views) if i not in removed_indices]
             
             # Calculate new dimensions (for after the animation)
             num_items = len(self._items)
-            edit_button_space = EDIT_BUTTON_HEIGHT + PADDING
-            items_height = ITEM_HEIGHT * num_items
-            new_total_content_height = items_height + edit_button_space + (PADDING * 3)
-            new_visible_height = min(new_total_content_height, POPUP_MAX_HEIGHT)
+            new_total_content_height = _CONTENT_HEIGHTS[num_items]
+            new_visible_height = _VISIBLE_HEIGHTS[num_items]
             
             # Store current values for the closure
             blur_width = self.contentView().bounds().size.width
+            inner_width = blur_width - (PADDING * 2)
             old_selected_index = self._selected_index
             
             # Figure out new selection - stay at same position if possible
@@ -235,162 +457,212 @@ class PopupAnimationMixin:
             
             # If we are deleting the LAST item (num_items == 0), just fade out the whole window
             if num_items == 0:
-                print(f"[Popup] Deleting last item, dismissing window", flush=True)
-                self.hide(animate=True)
-                
+                _trace("[Popup] Deleting last item, dismissing window")
                 # Capture popup reference for closure
                 popup = self
                 
-                # Cleanup state in background after window fades
-                def cleanup_last_item(timer):
-                    removed_view.removeFromSuperview()
-                    if removed_index < len(popup._item_views):
-                        popup._item_views.pop(removed_index)
-                    popup._items_container.setFrame_(NSMakeRect(0, 0, blur_width, 0))
-                    popup._selected_index = 0
-                    if popup._edit_button_view:
-                        popup._edit_button_view.set_selected(True) # Reset to edit button
+                # Cleanup state once the window has faded out
+                def cleanup_last_item():
+                    if popup._rebuild_generation != rebuild_generation:
+                        return  # Views were rebuilt meanwhile; nothing of ours is left
+                    for removed_view in removed_views:
+                        popup._recycle_item_view(removed_view)
+                    popup._removing_views.difference_update(removed_views)
+                    views = popup._item_views
+                    views[:] = [v for v in views if v not in removed_views]
+                    popup._items_container.setFrame_(((0, 0), (blur_width, 0)))
+                    popup._set_selection(0)  # Reset to edit button
                     
                     # Clear the deletion queue and mark complete since window is hidden
                     popup._deletion_in_progress = False
-                    popup._deletion_queue = []
-                    popup._pending_deletion_views = set()
-                        
-                NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
-                    0.25, False, cleanup_last_item
-                )
+                    popup._deletion_queue.clear()
+                    popup._pending_deletion_views.clear()
+                
+                self.hide(animate=True, completion=cleanup_last_item)
                 return
 
-            # Generalized Animation Logic:
-            NSAnimationContext.beginGrouping()
-            NSAnimationContext.currentContext().setDuration_(duration)
-            
-            # 1. Fade out the removed item
-            removed_view.animator().setAlphaValue_(0.0)
-            
-            # 2. Animate items ABOVE (index < removed_index) -> Move Down by delta
-            for i in range(removed_index):
-                view = self._item_views[i]
-                current_frame = view.frame()
-                new_y = current_frame.origin.y - height_delta
-                view.animator().setFrameOrigin_(NSMakePoint(current_frame.origin.x, new_y))
-            
-            # 3. Animate Edit Button -> Move Down by delta
-            if self._edit_button_view:
-                current_frame = self._edit_button_view.frame()
-                new_y = current_frame.origin.y - height_delta
-                self._edit_button_view.animator().setFrameOrigin_(NSMakePoint(current_frame.origin.x, new_y))
-
-            # 4. Animate items BELOW (index > removed_index) -> Move Up by (ITEM_HEIGHT - delta)
-            offset_below = ITEM_HEIGHT - height_delta
-            for i in range(removed_index + 1, len(self._item_views)):
-                view = self._item_views[i]
-                current_frame = view.frame()
-                new_y = current_frame.origin.y + offset_below
-                view.animator().setFrameOrigin_(NSMakePoint(current_frame.origin.x, new_y))
-            
-            # 5. Animate Selection View
-            if new_selected_index > 0 and new_selected_index - 1 < len(self._item_views):
-                target_index = new_selected_index - 1
-                
-                if target_index < removed_index:
-                    target_view = self._item_views[target_index]
-                    current_frame = target_view.frame()
-                    new_y = current_frame.origin.y - height_delta
-                    
-                elif target_index > removed_index:
-                    target_view = self._item_views[target_index]
-                    current_frame = target_view.frame()
-                    offset_below = ITEM_HEIGHT - height_delta
-                    new_y = current_frame.origin.y + offset_below
-                    
-                else: 
-                    current_frame = removed_view.frame()
-                    new_y = current_frame.origin.y - height_delta
-                
-                sel_frame = NSMakeRect(PADDING, new_y, blur_width - (PADDING * 2), ITEM_HEIGHT)
-                self._selection_view.animator().setFrame_(sel_frame)
-                
-            elif new_selected_index == 0 and self._edit_button_view:
-                current_frame = self._edit_button_view.frame()
-                new_y = current_frame.origin.y - height_delta
-                new_edit_frame = NSMakeRect(current_frame.origin.x, new_y, current_frame.size.width, current_frame.size.height)
-                self._selection_view.animator().setFrame_(new_edit_frame)
-            
-            # 6. Animate Window Resize
-            if height_delta != 0:
-                frame.size.height = new_visible_height
-                frame.origin.y += height_delta
-                self.animator().setFrame_display_(frame, True)
-            
-            NSAnimationContext.endGrouping()
-            
             # Capture values for the closure
             popup = self
+            geom = PopupGeometry(
+                blur_width=blur_width,
+                content_height=new_total_content_height,
+                edit_x=blur_width - PADDING - 64,
+                edit_y=new_total_content_height - PADDING - EDIT_BUTTON_HEIGHT,
+                item_base_y=new_total_content_height - PADDING - EDIT_BUTTON_SPACE - ITEM_HEIGHT,
+                item_width=inner_width,
+            )
+            
+            # (group view, offset) pairs the survivors are moved in; filled below
+            move_groups = []
             
-            # After animation completes, update container and window size
-            def cleanup_after_animation(timer):
+            # After animation completes, update container and window size.
+            # The final layout is bound as a default arg: one local instead of several closure cells.
+            def cleanup_after_animation(geom=geom):
+                # Snap to the final layout instantly: without this the direct
+                # setFrame calls below implicitly animate on layer-backed views
+                CATransaction.begin()
+                CATransaction.setDisableActions_(True)
                 try:
-                    print(f"[Popup] cleanup_after_animation running", flush=True)
+                    if popup._rebuild_generation != rebuild_generation:
+                        _trace("[Popup] Views rebuilt during removal animation, skipping cleanup")
+                        return
+                    _trace("[Popup] cleanup_after_animation running")
                     
-                    # Remove the deleted view
-                    removed_view.removeFromSuperview()
-                    if removed_index < len(popup._item_views):
-                        popup._item_views.pop(removed_index)
+                    # Put the survivors back from their temporary move groups
+                    container = popup._items_container
+                    for group, _ in move_groups:
+                        for subview in list(group.subviews()):
+                            container.addSubview_(subview)
+                        group.removeFromSuperview()
                     
-                    # Update indices for remaining views
-                    for i, view in enumerate(popup._item_views):
-                        view._index = i + 1  # 1-based index
+                    # Remove the deleted views (by identity: the list may
+                    # have been rebuilt while the animation ran)
+                    for removed_view in removed_views:
+                        popup._recycle_item_view(removed_view)
+                    popup._removing_views.difference_update(removed_views)
+                    views = popup._item_views
+                    views[:] = [v for v in views if v not in removed_views]
                     
                     # Resize container and edit button to match new content
-                    popup._items_container.setFrame_(NSMakeRect(0, 0, blur_width, new_total_content_height))
+                    popup._items_container.setFrame_(((0, 0), (geom.blur_width, geom.content_height)))
                     
                     # Reposition edit button
                     if popup._edit_button_view:
-                        edit_btn_x = blur_width - PADDING - 64
-                        edit_btn_y = new_total_content_height - PADDING - EDIT_BUTTON_HEIGHT
-                        popup._edit_button_view.setFrameOrigin_(NSMakePoint(edit_btn_x, edit_btn_y))
-                    
-                    # Reposition all items to their final correct positions
-                    for i, view in enumerate(popup._item_views):
-                        y = new_total_content_height - PADDING - edit_button_space - ((i + 1) * ITEM_HEIGHT)
-                        view.setFrameOrigin_(NSMakePoint(PADDING, y))
+                        popup._edit_button_view.setFrameOrigin_((geom.edit_x, geom.edit_y))
                     
-                    # Update selection
-                    popup._selected_index = new_selected_index
-                    
-                    # Deselect all first
-                    for view in popup._item_views:
-                        view.set_selected(False)
-                    if popup._edit_button_view:
-                        popup._edit_button_view.set_selected(False)
+                    # Update indices, snap all items to their final positions and
+                    # deselect them, touching each view exactly once
+                    pad = PADDING
+                    item_height = ITEM_HEIGHT
+                    base_y = geom.item_base_y
+                    y = base_y
+                    for i, view in enumerate(views):
+                        view._index = i + 1  # 1-based index
+                        view.setFrameOrigin_((pad, y))
+                        y -= item_height
                     
                     # Select the new item
+                    popup._set_selection(new_selected_index)
                     if new_selected_index == 0:
-                        if popup._edit_button_view:
-                            popup._edit_button_view.set_selected(True)
                         popup._selection_view.setHidden_(True)
-                    elif new_selected_index - 1 < len(popup._item_views):
-                        popup._item_views[new_selected_index - 1].set_selected(True)
+                    elif new_selected_index - 1 < len(views):
                         popup._selection_view.setHidden_(False)
-                        # Update selection view to correct position
-                        target_view = popup._item_views[new_selected_index - 1]
-                        popup._selection_view.setFrame_(target_view.frame())
+                        # Update selection view to the row's final frame (known
+                        # from geom, so no frame() read back from the view)
+                        popup._selection_view.setFrame_(
+                            ((pad, base_y - (new_selected_index - 1) * item_height), (geom.item_width, item_height))
+                        )
                     
-                    print(f"[Popup] cleanup_after_animation completed, new_selected={new_selected_index}", flush=True)
+                    _trace("[Popup] cleanup_after_animation completed, new_selected=%d", new_selected_index)
                 except Exception as e:
-                    print(f"[Popup] Error in cleanup_after_animation: {e}", flush=True)
+                    _dump_flight_recorder()
+                    logger.error("[Popup] Error in cleanup_after_animation: %s", e)
                     traceback.print_exc()
+                finally:
+                    CATransaction.commit()
             
-            def on_animation_complete(timer):
-                cleanup_after_animation(timer)
+            def on_animation_complete():
+                if popup._rebuild_generation != rebuild_generation:
+                    # A rebuild reset the deletion state; the flag and queue
+                    # now belong to whatever deletion started after it
+                    _trace("[Popup] Stale removal completion after rebuild, ignoring")
+                    return
+                cleanup_after_animation()
                 # Mark deletion as complete and process next in queue
                 popup._deletion_in_progress = False
                 popup._process_deletion_queue()
             
-            NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
-                duration + 0.05, False, on_animation_complete
-            )
+            # Nothing the user can see (hidden, fully occluded, on another Space):
+            # skip the animation commit and snap straight to the final layout
+            if not self._is_on_screen():
+                _trace("[Popup] Popup not on screen, skipping removal animation")
+                if height_delta != 0:
+                    frame.size.height = new_visible_height
+                    frame.origin.y += height_delta
+                    self.setFrame_display_(frame, False)
+                on_animation_complete()
+                return
+            
+            # Origins are snapshotted once as plain (x, y) tuples; PyObjC accepts
+            # tuples wherever an NSPoint is expected, so no struct boxing is needed.
+            # Frames are read once here (each frame() is a bridge round-trip) and
+            # reused below, so later reads can't observe animator() targets.
+            origins = [(o.x, o.y) for o in (v.frame().origin for v in views)]
+            edit_frame = self._edit_button_view.frame() if self._edit_button_view else None
+            
+            # Single pass over the item views. Every survivor moves down by delta
+            # (the window's bottom edge moves up) and back up one row for each
+            # removed view above it. The removed views themselves fade out.
+            # Survivors sharing an offset are grouped, so each run of rows animates
+            # as one view: two groups for a single delete instead of one per row.
+            offset_groups = {}
+            survivor_offsets = []
+            removed_above = 0
+            for i, view in enumerate(views):
+                if i in removed_indices:
+                    removed_above += 1
+                    continue
+                offset = removed_above * ITEM_HEIGHT - height_delta
+                offset_groups.setdefault(offset, []).append(view)
+                survivor_offsets.append((i, offset))
+            
+            # Edit Button -> Move Down by delta, along with the rows above
+            if edit_frame is not None:
+                offset_groups.setdefault(-height_delta, []).append(self._edit_button_view)
+            
+            # Reparent each run into a transparent group view covering the
+            # container, so subview frames are unchanged until the group moves
+            container = self._items_container
+            container_bounds = container.bounds()
+            for offset, members in offset_groups.items():
+                group = _MoveGroupView.alloc().initWithFrame_(container_bounds)
+                group.setWantsLayer_(True)
+                container.addSubview_(group)
+                for member in members:
+                    group.addSubview_(member)
+                move_groups.append((group, offset))
+            
+            # Flush pending layout once so the animation starts from settled frames
+            self.contentView().layoutSubtreeIfNeeded()
+            
+            # Generalized Animation Logic: one explicit transaction for the whole reflow
+            CATransaction.begin()
+            CATransaction.setDisableActions_(False)
+            CATransaction.setAnimationDuration_(duration)
+            NSAnimationContext.beginGrouping()
+            NSAnimationContext.currentContext().setDuration_(duration)
+            # Cleanup runs exactly when every animation in this group has finished
+            NSAnimationContext.currentContext().setCompletionHandler_(on_animation_complete)
+            
+            # 4. Fade out the removed items and move each group
+            for removed_view in removed_views:
+                removed_view.animator().setAlphaValue_(0.0)
+            for group, offset in move_groups:
+                group.animator().setFrameOrigin_((container_bounds.origin.x, container_bounds.origin.y + offset))
+            
+            # 5. Animate Selection View
+            if new_selected_index > 0 and new_selected_index - 1 < len(survivors):
+                # Survivors are in final order, so the selected row is the
+                # (new_selected_index - 1)-th survivor
+                i, offset = survivor_offsets[new_selected_index - 1]
+                new_y = origins[i][1] + offset
+                sel_frame = ((PADDING, new_y), (inner_width, ITEM_HEIGHT))
+                self._selection_view.animator().setFrame_(sel_frame)
+                
+            elif new_selected_index == 0 and edit_frame is not None:
+                new_edit_frame = ((edit_frame.origin.x, edit_frame.origin.y - height_delta), edit_frame.size)
+                self._selection_view.animator().setFrame_(new_edit_frame)
+            
+            # 6. Animate Window Resize
+            if height_delta != 0:
+                frame.size.height = new_visible_height
+                frame.origin.y += height_delta
+                self.animator().setFrame_display_(frame, True)
+            
+            NSAnimationContext.endGrouping()
+            CATransaction.commit()
+            
         except Exception as e:
-            print(f"[Popup] Error in _animate_item_removal: {e}", flush=True)
+            _dump_flight_recorder()
+            logger.error("[Popup] Error in _animate_batched_removal: %s", e)
             traceback.print_exc()
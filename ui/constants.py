@@ -17,3 +17,10 @@ ANIMATION_DURATION = 0.18
 # Edit mode
 EDIT_BUTTON_HEIGHT = 26
 DELETE_BUTTON_SIZE = 24
+EDIT_BUTTON_SPACE = EDIT_BUTTON_HEIGHT + PADDING  # Edit button row plus its gap
+
+# Maximum number of items shown in the popup
+MAX_POPUP_ITEMS = 50
+
+# Detached item views kept for reuse across rebuilds and deletions
+ITEM_VIEW_POOL_SIZE = MAX_POPUP_ITEMS
@@ -12,7 +12,6 @@ from AppKit import (
     NSCursor,
     NSTrackingArea,
     NSTrackingMouseEnteredAndExited,
-    NSTrackingMouseMoved,
     NSTrackingActiveAlways,
     NSTrackingInVisibleRect,
     NSMakeRect,
@@ -20,9 +19,56 @@ from AppKit import (
     NSImage,
     NSTextAlignmentLeft,
 )
+from Quartz import CATransaction
 
 from .constants import EDIT_BUTTON_HEIGHT, PADDING
 
+# Duration of the Edit <-> Done cross-fade, in seconds
+EDIT_MODE_FADE_DURATION = 0.2
+
+# Shared AppKit resources, created on first use (SF Symbol lookups and
+# font construction are not free) and reused by every button.
+_PENCIL_IMG = None
+_CHECK_IMG = None
+_LABEL_FONT = None
+_DIM_COLOR = None
+_BRIGHT_COLOR = None
+
+
+def _pencil_image():
+    global _PENCIL_IMG
+    if _PENCIL_IMG is None:
+        _PENCIL_IMG = NSImage.imageWithSystemSymbolName_accessibilityDescription_("pencil", None)
+    return _PENCIL_IMG
+
+
+def _check_image():
+    global _CHECK_IMG
+    if _CHECK_IMG is None:
+        _CHECK_IMG = NSImage.imageWithSystemSymbolName_accessibilityDescription_("checkmark", None)
+    return _CHECK_IMG
+
+
+def _label_font():
+    global _LABEL_FONT
+    if _LABEL_FONT is None:
+        _LABEL_FONT = NSFont.systemFontOfSize_weight_(11, 0.0)
+    return _LABEL_FONT
+
+
+def _dim_color():
+    global _DIM_COLOR
+    if _DIM_COLOR is None:
+        _DIM_COLOR = NSColor.colorWithWhite_alpha_(0.7, 1.0)
+    return _DIM_COLOR
+
+
+def _bright_color():
+    global _BRIGHT_COLOR
+    if _BRIGHT_COLOR is None:
+        _BRIGHT_COLOR = NSColor.colorWithWhite_alpha_(1.0, 1.0)
+    return _BRIGHT_COLOR
+
 
 class EditButtonView(NSView):
     """A toggle button for edit mode with pencil icon and Edit/Done text."""
@@ -44,6 +90,9 @@ class EditButtonView(NSView):
     
     def _setup_content(self):
         """Create separate icon and label pairs for Edit and Done states to allow cross-fading."""
+        # Layer-backed, so the layer stays GPU-resident with no backing store
+        self.setWantsLayer_(True)
+        
         # Common layout
         icon_size = 12
         label_width = 34
@@ -64,10 +113,10 @@ class EditButtonView(NSView):
             NSMakeRect(icon_x + 2, icon_y, icon_size, icon_size)
         )
         self._edit_icon.setWantsLayer_(True)
-        edit_img = NSImage.imageWithSystemSymbolName_accessibilityDescription_("pencil", None)
+        edit_img = _pencil_image()
         if edit_img:
             self._edit_icon.setImage_(edit_img)
-            self._edit_icon.setContentTintColor_(NSColor.colorWithWhite_alpha_(0.7, 1.0))
+            self._edit_icon.setContentTintColor_(_dim_color())
         self.addSubview_(self._edit_icon)
         
         self._edit_label = NSTextField.alloc().initWithFrame_(
@@ -80,8 +129,8 @@ class EditButtonView(NSView):
         self._edit_label.setDrawsBackground_(False)
         self._edit_label.setEditable_(False)
         self._edit_label.setSelectable_(False)
-        self._edit_label.setTextColor_(NSColor.colorWithWhite_alpha_(0.7, 1.0))
-        self._edit_label.setFont_(NSFont.systemFontOfSize_weight_(11, 0.0))
+        self._edit_label.setTextColor_(_dim_color())
+        self._edit_label.setFont_(_label_font())
         self.addSubview_(self._edit_label)
         
         # --- Done State Views (Hidden initially) ---
@@ -90,10 +139,10 @@ class EditButtonView(NSView):
         )
         self._done_icon.setWantsLayer_(True)
         self._done_icon.setAlphaValue_(0.0)
-        done_img = NSImage.imageWithSystemSymbolName_accessibilityDescription_("checkmark", None)
+        done_img = _check_image()
         if done_img:
             self._done_icon.setImage_(done_img)
-            self._done_icon.setContentTintColor_(NSColor.colorWithWhite_alpha_(0.7, 1.0))
+            self._done_icon.setContentTintColor_(_dim_color())
         self.addSubview_(self._done_icon)
         
         self._done_label = NSTextField.alloc().initWithFrame_(
@@ -107,15 +156,14 @@ class EditButtonView(NSView):
         self._done_label.setDrawsBackground_(False)
         self._done_label.setEditable_(False)
         self._done_label.setSelectable_(False)
-        self._done_label.setTextColor_(NSColor.colorWithWhite_alpha_(0.7, 1.0))
-        self._done_label.setFont_(NSFont.systemFontOfSize_weight_(11, 0.0))
+        self._done_label.setTextColor_(_dim_color())
+        self._done_label.setFont_(_label_font())
         self.addSubview_(self._done_label)
     
     def _setup_tracking(self):
         """Set up mouse tracking for hover effects."""
         options = (
             NSTrackingMouseEnteredAndExited |
-            NSTrackingMouseMoved |
             NSTrackingActiveAlways |
             NSTrackingInVisibleRect
         )
@@ -130,7 +178,7 @@ class EditButtonView(NSView):
         
         from AppKit import NSAnimationContext
         NSAnimationContext.beginGrouping()
-        NSAnimationContext.currentContext().setDuration_(0.2)
+        NSAnimationContext.currentContext().setDuration_(EDIT_MODE_FADE_DURATION)
         
         if enabled:
             # Show Done, Hide Edit
@@ -147,32 +195,38 @@ class EditButtonView(NSView):
             
         NSAnimationContext.endGrouping()
     
+    def reset_state(self):
+        """Return to the unselected Edit state without animating, for reuse after a rebuild."""
+        self._is_edit_mode = False
+        self._edit_icon.setAlphaValue_(1.0)
+        self._edit_label.setAlphaValue_(1.0)
+        self._done_icon.setAlphaValue_(0.0)
+        self._done_label.setAlphaValue_(0.0)
+        self.set_selected(False)
+    
     def set_selected(self, selected: bool):
         """Update selection state colors."""
+        if selected == self._is_selected:
+            return
         self._is_selected = selected
         
-        if selected:
-            color = NSColor.colorWithWhite_alpha_(1.0, 1.0)
-        else:
-            color = NSColor.colorWithWhite_alpha_(0.7, 1.0)
-            
+        color = _bright_color() if selected else _dim_color()
+        
+        # One commit for all four color changes, with no implicit tint fade.
+        # No setNeedsDisplay_: the view draws nothing itself.
+        CATransaction.begin()
+        CATransaction.setDisableActions_(True)
         self._edit_label.setTextColor_(color)
         self._edit_icon.setContentTintColor_(color)
         self._done_label.setTextColor_(color)
         self._done_icon.setContentTintColor_(color)
-        
-        self.setNeedsDisplay_(True)
+        CATransaction.commit()
     
     def mouseEntered_(self, event):
         """Update selection when mouse enters."""
         if self._on_hover:
             self._on_hover(self._index)
     
-    def mouseMoved_(self, event):
-        """Update selection when mouse moves within the button."""
-        if self._on_hover:
-            self._on_hover(self._index)
-    
     def mouseExited_(self, event):
         pass
     
@@ -185,7 +239,8 @@ class EditButtonView(NSView):
         """Set the cursor to a pointing hand when hovering."""
         self.addCursorRect_cursor_(self.bounds(), NSCursor.pointingHandCursor())
     
-    def drawRect_(self, rect):
-        """Draw background - handled by floating selection view."""
-        pass
+    def wantsUpdateLayer(self):
+        """Layer-only view: background is handled by the floating selection view,
+        so there is nothing to rasterize in drawRect_."""
+        return True
 
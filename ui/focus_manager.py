@@ -7,8 +7,21 @@ from Quartz import (
     kCGHIDEventTap,
     kCGEventFlagMaskCommand,
 )
+from libdispatch import (
+    dispatch_after,
+    dispatch_get_main_queue,
+    dispatch_time,
+    DISPATCH_TIME_NOW,
+)
+import logging
 import traceback
 
+logger = logging.getLogger(__name__)
+
+# Delay between refocusing the original app and posting Cmd+V, in seconds
+PASTE_DELAY = 0.1
+
+
 class FocusManager:
     """
     Manages focus storage, restoration, and paste simulation for the ClipboardPopup.
@@ -16,6 +29,9 @@ class FocusManager:
     def __init__(self):
         self._original_focused_element = None
         self._original_frontmost_app = None
+        # Cmd+V key down/up events, built on first paste and reposted after that
+        self._paste_down = None
+        self._paste_up = None
 
     def store_focused_element(self, element: Any):
         """Store the currently focused element to restore later."""
@@ -30,9 +46,9 @@ class FocusManager:
         if self._original_frontmost_app is not None:
             try:
                 self._original_frontmost_app.activateWithOptions_(0)
-                print(f"[FocusManager] Activated app: {self._original_frontmost_app.localizedName()}", flush=True)
+                logger.debug("[FocusManager] Activated app: %s", self._original_frontmost_app.localizedName())
             except Exception as e:
-                print(f"[FocusManager] Could not activate app: {e}", flush=True)
+                logger.warning("[FocusManager] Could not activate app: %s", e)
         self._original_frontmost_app = None
 
     def refocus_original_element(self):
@@ -43,40 +59,41 @@ class FocusManager:
         try:
             from ApplicationServices import AXUIElementPerformAction
             AXUIElementPerformAction(self._original_focused_element, "AXFocus")
-            print("[FocusManager] Refocused original element", flush=True)
+            logger.debug("[FocusManager] Refocused original element")
         except Exception as e:
-            print(f"[FocusManager] Could not refocus original element: {e}", flush=True)
+            logger.warning("[FocusManager] Could not refocus original element: %s", e)
         finally:
             self._original_focused_element = None
 
     def simulate_paste(self):
         """Simulate Cmd+V keystroke to paste."""
-        print("[FocusManager] Executing paste...", flush=True)
+        logger.debug("[FocusManager] Executing paste...")
         
-        KEY_V = 9
+        if self._paste_down is None:
+            KEY_V = 9
+            self._paste_down = CGEventCreateKeyboardEvent(None, KEY_V, True)
+            CGEventSetFlags(self._paste_down, kCGEventFlagMaskCommand)
+            self._paste_up = CGEventCreateKeyboardEvent(None, KEY_V, False)
+            CGEventSetFlags(self._paste_up, kCGEventFlagMaskCommand)
         
-        # Press Cmd+V
-        event = CGEventCreateKeyboardEvent(None, KEY_V, True)
-        CGEventSetFlags(event, kCGEventFlagMaskCommand)
-        CGEventPost(kCGHIDEventTap, event)
-        
-        # Release Cmd+V
-        event = CGEventCreateKeyboardEvent(None, KEY_V, False)
-        CGEventSetFlags(event, kCGEventFlagMaskCommand)
-        CGEventPost(kCGHIDEventTap, event)
+        # Press and release Cmd+V
+        CGEventPost(kCGHIDEventTap, self._paste_down)
+        CGEventPost(kCGHIDEventTap, self._paste_up)
 
     def perform_paste_sequence(self):
         """Refocus original app/element and simulate paste with a delay."""
-        from Foundation import NSTimer
-        
         # 1. Activate App and Focus Element
         self.refocus_original_app()
         self.refocus_original_element()
         
-        # 2. Schedule Paste
-        def do_paste(timer):
+        # 2. Schedule Paste on the main queue. Unlike an NSTimer, a dispatch
+        # timer carries the system's default leeway, so the wakeup can be
+        # coalesced with others.
+        def do_paste():
              self.simulate_paste()
-             
-        NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
-             0.1, False, do_paste
+        
+        dispatch_after(
+            dispatch_time(DISPATCH_TIME_NOW, int(PASTE_DELAY * 1e9)),
+            dispatch_get_main_queue(),
+            do_paste
         )
@@ -2,6 +2,8 @@
 ClipboardItemView - A single clipboard item row in the popup.
 """
 
+from collections import namedtuple
+from functools import lru_cache
 from typing import Callable, Optional
 
 from AppKit import (
@@ -10,146 +12,215 @@ from AppKit import (
     NSColor,
     NSFont,
     NSCursor,
-    NSTrackingArea,
-    NSTrackingMouseEnteredAndExited,
-    NSTrackingMouseMoved,
-    NSTrackingActiveAlways,
-    NSTrackingInVisibleRect,
     NSMakeRect,
+    NSImageView,
+    NSImageScaleProportionallyUpOrDown,
+    NSImage,
+    NSTextAlignmentRight,
+    NSAttributedString,
+    NSMutableAttributedString,
+    NSForegroundColorAttributeName,
+    NSFontAttributeName,
+    NSAnimationContext,
 )
 
-from clipboard_monitor import ClipboardItem
+from clipboard_monitor import ClipboardItem, VIEW_HAS_THUMBNAIL, VIEW_HAS_PHOTO_ICON
 from .constants import ITEM_HEIGHT, PADDING, DELETE_BUTTON_SIZE
 
+# Shared styling, created once at import instead of per row
+_LABEL_COLOR = NSColor.colorWithWhite_alpha_(0.8, 1.0)
+_ELLIPSIS_COLOR = NSColor.colorWithWhite_alpha_(0.5, 1.0)
+_WHITE = NSColor.whiteColor()
+_FONT_SMALL = NSFont.systemFontOfSize_weight_(11.0, 0.0)
+_FONT_LARGE = NSFont.systemFontOfSize_weight_(13.0, 0.0)
+_TIME_FONT = _FONT_SMALL
+
+# Fixed row geometry
+_THUMB_SIZE = 32
+_THUMB_MARGIN = 6
+_THUMB_Y = (ITEM_HEIGHT - _THUMB_SIZE) / 2
+_ICON_SIZE = 14
+_DELETE_SIZE = 20
+_DELETE_Y = 6
+_DELETE_ICON_INSET = 5
+
+# SF Symbols and the delete button fill shared by every row, created on first use
+_PHOTO_IMG = None
+_TRASH_IMG = None
+_DELETE_BG_CGCOLOR = None
+
+
+def _photo_image():
+    global _PHOTO_IMG
+    if _PHOTO_IMG is None:
+        _PHOTO_IMG = NSImage.imageWithSystemSymbolName_accessibilityDescription_("photo", None)
+    return _PHOTO_IMG
+
+
+def _trash_image():
+    global _TRASH_IMG
+    if _TRASH_IMG is None:
+        _TRASH_IMG = NSImage.imageWithSystemSymbolName_accessibilityDescription_("trash", None)
+    return _TRASH_IMG
+
+
+def _delete_bg_cgcolor():
+    global _DELETE_BG_CGCOLOR
+    if _DELETE_BG_CGCOLOR is None:
+        _DELETE_BG_CGCOLOR = NSColor.colorWithRed_green_blue_alpha_(0.9, 0.3, 0.3, 0.4).CGColor()
+    return _DELETE_BG_CGCOLOR
+
+
+# Subview frames for one row as (x, y, w, h) tuples; thumb/icon are None when
+# the variant has no such subview
+_RowLayout = namedtuple("_RowLayout", "thumb_rect icon_rect label_rect time_rect delete_rect")
+
+
+@lru_cache(maxsize=8)
+def _row_layout(variant: int, width: float) -> _RowLayout:
+    """Compute the subview frames for a row of the given variant and width."""
+    thumb_rect = None
+    if variant & VIEW_HAS_THUMBNAIL:
+        thumb_rect = (PADDING, _THUMB_Y, _THUMB_SIZE, _THUMB_SIZE)
+        label_x = PADDING + _THUMB_SIZE + _THUMB_MARGIN
+        label_width = width - label_x - PADDING
+    else:
+        label_x = PADDING
+        label_width = width - PADDING * 2
+    
+    icon_rect = None
+    is_image = bool(variant & VIEW_HAS_PHOTO_ICON)
+    if is_image:
+        label_x += 12
+        # Only shift the text over if the "photo" symbol is available
+        if _photo_image():
+            icon_rect = (label_x, 31, _ICON_SIZE, _ICON_SIZE)
+            label_x += _ICON_SIZE + 8
+            label_width -= (_ICON_SIZE + 8 + 12)
+    
+    label_rect = (label_x, 26, label_width, 20 if is_image else 44)
+    time_rect = (label_x, 6, label_width, 16)
+    delete_rect = (width - PADDING - _DELETE_SIZE, _DELETE_Y, _DELETE_SIZE, _DELETE_SIZE)
+    return _RowLayout(thumb_rect, icon_rect, label_rect, time_rect, delete_rect)
+
+
+# Preview text and ellipsis attributes, keyed by font
+_TEXT_ATTRS = {
+    font: {NSForegroundColorAttributeName: _LABEL_COLOR, NSFontAttributeName: font}
+    for font in (_FONT_SMALL, _FONT_LARGE)
+}
+# Grey "..." suffix, prebuilt per font
+_ELLIPSIS_STRINGS = {
+    font: NSAttributedString.alloc().initWithString_attributes_(
+        "...", {NSForegroundColorAttributeName: _ELLIPSIS_COLOR, NSFontAttributeName: font}
+    )
+    for font in (_FONT_SMALL, _FONT_LARGE)
+}
+
 
 class ClipboardItemView(NSView):
     """A single clipboard item row in the popup."""
     
+    # Detached views waiting for reuse, keyed by ClipboardItem.view_variant.
+    # Rows are only re-bound to items of the same variant, so the
+    # thumbnail/icon subviews never have to be added or removed on reuse.
+    _reuse_pools = {}
+    
     @classmethod
     def alloc_with_item(cls, item: ClipboardItem, index: int, width: float, 
                         on_click: Optional[Callable[[int], None]] = None,
-                        on_hover: Optional[Callable[[int], None]] = None,
                         on_delete: Optional[Callable[[int], None]] = None):
         view = cls.alloc().initWithFrame_(NSMakeRect(0, 0, width, ITEM_HEIGHT))
-        view._item = item
-        view._index = index
-        view._is_selected = False
-        view._is_edit_mode = False
-        view._on_click = on_click
-        view._on_hover = on_hover
-        view._on_delete = on_delete
-        view._setup_label()
-        view._setup_tracking()
+        view._variant = item.view_variant
+        view._build_chrome()
+        view.configure_with_item(item, index, on_click=on_click, on_delete=on_delete)
         return view
     
-    def _setup_label(self):
-        """Create the text label and optional image thumbnail."""
-        from AppKit import (
-            NSImageView, 
-            NSImageScaleProportionallyUpOrDown, 
-            NSImage, 
-            NSTextAlignmentRight,
-            NSMutableAttributedString,
-            NSForegroundColorAttributeName,
-            NSFontAttributeName
-        )
+    @classmethod
+    def dequeue_with_item(cls, item: ClipboardItem, index: int, width: float,
+                          on_click: Optional[Callable[[int], None]] = None,
+                          on_delete: Optional[Callable[[int], None]] = None):
+        """Like alloc_with_item, but reuses a pooled view of the same variant when there is one."""
+        pool = cls._reuse_pools.get(item.view_variant)
+        while pool:
+            view = pool.pop()
+            if view.frame().size.width == width:
+                view.configure_with_item(item, index, on_click=on_click, on_delete=on_delete)
+                return view
+        return cls.alloc_with_item(item, index, width, on_click=on_click, on_delete=on_delete)
+    
+    def enqueue_for_reuse(self, max_pool_size: int) -> bool:
+        """Detach this view into its variant's reuse pool. Returns False (and just
+        detaches) if that pool is already full."""
+        self.removeFromSuperviewWithoutNeedingDisplay()
+        pool = self._reuse_pools.setdefault(self._variant, [])
+        if len(pool) >= max_pool_size:
+            return False
+        self._reset_for_reuse()
+        pool.append(self)
+        return True
+    
+    def configure_with_item(self, item: ClipboardItem, index: int,
+                            on_click: Optional[Callable[[int], None]] = None,
+                            on_delete: Optional[Callable[[int], None]] = None):
+        """Bind an item's content to this view (fresh or reused). Creates no subviews."""
+        self._item = item
+        self._index = index
+        self._is_selected = False
+        self._is_edit_mode = False
+        self._on_click = on_click
+        self._on_delete = on_delete
+        self._apply_item(item)
+    
+    def _reset_for_reuse(self):
+        """Drop item content and restore the at-rest appearance."""
+        self.setAlphaValue_(1.0)
+        self._time_label.setAlphaValue_(1.0)
+        if self._delete_button is not None:
+            self._delete_button.setAlphaValue_(0.0)
+        self._item = None
+        self._on_click = None
+        self._on_delete = None
+    
+    def _build_chrome(self):
+        """Create the row's subviews for its variant. Called once per view."""
+        # Flatten the row's static subviews into a single layer. The row stays
+        # transparent: the blur and the selection pill behind it must show through.
+        self.setWantsLayer_(True)
+        self.setCanDrawSubviewsIntoLayer_(True)
+        self.layer().setDrawsAsynchronously_(True)
         
-        # Check if item has an image thumbnail
-        has_thumbnail = hasattr(self._item, 'has_image') and self._item.has_image() and self._item.thumbnail
+        # Every child is created with its final frame; hold off autoresizing
+        # until they are all installed so AppKit lays the row out once
+        self.setAutoresizesSubviews_(False)
         
-        # Thumbnail size and position
-        thumb_size = 32
-        thumb_margin = 6
+        layout = _row_layout(self._variant, self.frame().size.width)
         
-        if has_thumbnail:
-            label_x = PADDING + thumb_size + thumb_margin
-            label_width = self.frame().size.width - label_x - PADDING
-            
+        self._thumbnail_view = None
+        if layout.thumb_rect is not None:
             # Create image view for thumbnail
-            self._thumbnail_view = NSImageView.alloc().initWithFrame_(
-                NSMakeRect(PADDING, (ITEM_HEIGHT - thumb_size) / 2, thumb_size, thumb_size)
-            )
-            self._thumbnail_view.setImage_(self._item.thumbnail)
+            self._thumbnail_view = NSImageView.alloc().initWithFrame_(NSMakeRect(*layout.thumb_rect))
             self._thumbnail_view.setImageScaling_(NSImageScaleProportionallyUpOrDown)
             self._thumbnail_view.setWantsLayer_(True)
             self._thumbnail_view.layer().setCornerRadius_(4)
             self._thumbnail_view.layer().setMasksToBounds_(True)
             self.addSubview_(self._thumbnail_view)
-        else:
-            label_x = PADDING
-            label_width = self.frame().size.width - PADDING * 2
-        
-        if self._item.content_type == "image":
-            # Add SVG icon (SF Symbol)
-            label_x += 12
-            
-            icon_size = 14
-            icon_view = NSImageView.alloc().initWithFrame_(
-                NSMakeRect(label_x, 31, icon_size, icon_size)
-            )
-            # Use "photo" symbol for images
-            icon_image = NSImage.imageWithSystemSymbolName_accessibilityDescription_("photo", None)
-            if icon_image:
-                icon_view.setImage_(icon_image)
-                icon_view.setContentTintColor_(NSColor.colorWithWhite_alpha_(0.8, 1.0))
-                self.addSubview_(icon_view)
-                label_x += icon_size + 8
-                label_width -= (icon_size + 8 + 12)
-
-        # Preview text - Primary
-        text_length = len(self._item.preview)
-        is_long = text_length > 60
-        
-        font_size = 11.0 if is_long else 13.0
-        font_weight = 0.0  # Regular
-        
-        # Determine label frame based on content type
-        if self._item.content_type == "image":
-            label_frame = NSMakeRect(label_x, 26, label_width, 20)
-        else:
-            label_frame = NSMakeRect(label_x, 26, label_width, 44)
-            
-        self._label = NSTextField.alloc().initWithFrame_(label_frame)
-        
-        # Prepare content with grey ellipsis
-        raw_text = self._item.preview
-        display_text = raw_text
-        needs_ellipsis = False
-        
-        if len(raw_text) > 130:
-            display_text = raw_text[:130]
-            needs_ellipsis = True
-        elif raw_text.endswith("..."):
-            display_text = raw_text[:-3]
-            needs_ellipsis = True
-            
-        # Create attributed string
-        attr_str = NSMutableAttributedString.alloc().initWithString_(display_text)
         
-        # Base attributes
-        font = NSFont.systemFontOfSize_weight_(font_size, font_weight)
-        attrs = {
-            NSForegroundColorAttributeName: NSColor.colorWithWhite_alpha_(0.8, 1.0),
-            NSFontAttributeName: font
-        }
-        attr_str.addAttributes_range_(attrs, (0, len(display_text)))
-        
-        if needs_ellipsis:
-            ellipsis_str = NSMutableAttributedString.alloc().initWithString_("...")
-            ellipsis_attrs = {
-                NSForegroundColorAttributeName: NSColor.colorWithWhite_alpha_(0.5, 1.0),
-                NSFontAttributeName: font
-            }
-            ellipsis_str.addAttributes_range_(ellipsis_attrs, (0, 3))
-            attr_str.appendAttributedString_(ellipsis_str)
-            
-        self._label.setAttributedStringValue_(attr_str)
+        if layout.icon_rect is not None:
+            # "photo" SF Symbol for images
+            icon_view = NSImageView.alloc().initWithFrame_(NSMakeRect(*layout.icon_rect))
+            icon_view.setImage_(_photo_image())
+            icon_view.setContentTintColor_(_LABEL_COLOR)
+            self.addSubview_(icon_view)
         
+        # Preview text - Primary (content is set per item in _apply_item)
+        self._label = NSTextField.alloc().initWithFrame_(NSMakeRect(*layout.label_rect))
+        self._attr_buffer = NSMutableAttributedString.alloc().init()
         self._label.setBezeled_(False)
         self._label.setDrawsBackground_(False)
         self._label.setEditable_(False)
         self._label.setSelectable_(False)
-        self._label.setTextColor_(NSColor.whiteColor())
+        self._label.setTextColor_(_WHITE)
         
         # Configure for multi-line
         self._label.setMaximumNumberOfLines_(3)
@@ -159,97 +230,118 @@ class ClipboardItemView(NSView):
         self.addSubview_(self._label)
         
         # Timestamp - Right aligned
-        time_str = self._item.timestamp.strftime("%H:%M")
-        self._time_label = NSTextField.alloc().initWithFrame_(
-            NSMakeRect(label_x, 6, label_width, 16)
-        )
-        self._time_label.setStringValue_(time_str)
+        self._time_label = NSTextField.alloc().initWithFrame_(NSMakeRect(*layout.time_rect))
         self._time_label.setAlignment_(NSTextAlignmentRight)
         self._time_label.setBezeled_(False)
         self._time_label.setDrawsBackground_(False)
         self._time_label.setEditable_(False)
         self._time_label.setSelectable_(False)
-        self._time_label.setTextColor_(NSColor.whiteColor())
-        self._time_label.setFont_(NSFont.systemFontOfSize_weight_(11, 0.0))
+        self._time_label.setTextColor_(_WHITE)
+        self._time_label.setFont_(_TIME_FONT)
         self._time_label.setWantsLayer_(True)
         self.addSubview_(self._time_label)
         
-        # Delete button (hidden by default, shown in edit mode)
-        del_size = 20
-        delete_btn_y = 6
-        delete_btn_x = self.frame().size.width - PADDING - del_size
+        # Delete button is built on first entry into edit mode
+        self._delete_button = None
         
-        self._delete_button = NSView.alloc().initWithFrame_(
-            NSMakeRect(delete_btn_x, delete_btn_y, del_size, del_size)
-        )
+        self.setAutoresizesSubviews_(True)
+        self.setNeedsLayout_(True)
+    
+    def _ensure_delete_button(self):
+        """Build the (initially transparent) delete button the first time it is needed."""
+        if self._delete_button is not None:
+            return
+        
+        layout = _row_layout(self._variant, self.frame().size.width)
+        self._delete_button = NSView.alloc().initWithFrame_(NSMakeRect(*layout.delete_rect))
         self._delete_button.setWantsLayer_(True)
-        self._delete_button.layer().setCornerRadius_(del_size / 2)
-        self._delete_button.layer().setBackgroundColor_(
-            NSColor.colorWithRed_green_blue_alpha_(0.9, 0.3, 0.3, 0.4).CGColor()
-        )
+        self._delete_button.layer().setCornerRadius_(_DELETE_SIZE / 2)
+        self._delete_button.layer().setBackgroundColor_(_delete_bg_cgcolor())
         
         # Trash icon
-        icon_inset = 5
+        icon_size = _DELETE_SIZE - _DELETE_ICON_INSET * 2
         trash_icon = NSImageView.alloc().initWithFrame_(
-            NSMakeRect(icon_inset, icon_inset, del_size - (icon_inset * 2), del_size - (icon_inset * 2))
+            NSMakeRect(_DELETE_ICON_INSET, _DELETE_ICON_INSET, icon_size, icon_size)
         )
-        trash_image = NSImage.imageWithSystemSymbolName_accessibilityDescription_("trash", None)
+        trash_image = _trash_image()
         if trash_image:
             trash_icon.setImage_(trash_image)
-            trash_icon.setContentTintColor_(NSColor.whiteColor())
+            trash_icon.setContentTintColor_(_WHITE)
         self._delete_button.addSubview_(trash_icon)
         self._delete_button.setAlphaValue_(0.0)
         self._delete_button.setHidden_(False)
         self.addSubview_(self._delete_button)
     
-    def _setup_tracking(self):
-        """Set up mouse tracking for hover effects."""
-        options = (
-            NSTrackingMouseEnteredAndExited |
-            NSTrackingMouseMoved |
-            NSTrackingActiveAlways |
-            NSTrackingInVisibleRect
-        )
-        tracking = NSTrackingArea.alloc().initWithRect_options_owner_userInfo_(
-            self.bounds(), options, self, None
-        )
-        self.addTrackingArea_(tracking)
-    
-    def drawRect_(self, rect):
-        """Draw the background - handled by the floating selection view."""
-        pass
-    
-    def mouseEntered_(self, event):
-        """Update selection when mouse enters."""
-        if self._on_hover:
-            self._on_hover(self._index)
-
-    def mouseMoved_(self, event):
-        """Update selection when mouse moves within the item."""
-        if self._on_hover:
-            self._on_hover(self._index)
-    
-    def mouseExited_(self, event):
-        pass
+    def _apply_item(self, item: ClipboardItem):
+        """Update the row's content (thumbnail, preview text, timestamp) for item."""
+        if self._thumbnail_view is not None:
+            self._thumbnail_view.setImage_(item.thumbnail)
+        
+        # Preview text - Primary
+        text_length = len(item.preview)
+        is_long = text_length > 60
+        
+        font = _FONT_SMALL if is_long else _FONT_LARGE
+        
+        # Prepare content with grey ellipsis
+        raw_text = item.preview
+        display_text = raw_text
+        needs_ellipsis = False
+        
+        if len(raw_text) > 130:
+            display_text = raw_text[:130]
+            needs_ellipsis = True
+        elif raw_text.endswith("..."):
+            display_text = raw_text[:-3]
+            needs_ellipsis = True
+            
+        if not needs_ellipsis:
+            # Single style: the cell's own font and color are enough
+            self._label.setFont_(font)
+            self._label.setTextColor_(_LABEL_COLOR)
+            self._label.setStringValue_(display_text)
+        else:
+            # Restyle the view's own attributed string buffer in place (the label
+            # cell copies it). Ranges use the buffer's length, which counts UTF-16
+            # units, not Python characters.
+            attr_str = self._attr_buffer
+            attr_str.replaceCharactersInRange_withString_((0, attr_str.length()), display_text)
+            attr_str.setAttributes_range_(_TEXT_ATTRS[font], (0, attr_str.length()))
+            attr_str.appendAttributedString_(_ELLIPSIS_STRINGS[font])
+            self._label.setAttributedStringValue_(attr_str)
+        
+        # Timestamp
+        self._time_label.setStringValue_(item.time_str)
     
     def mouseDown_(self, event):
         """Handle click on this item."""
         if self._on_click:
             self._on_click(self._index)
     
+    def isOpaque(self):
+        """Rows are translucent over the blur; AppKit must composite what is behind them."""
+        return False
+
     def resetCursorRects(self):
         """Set the cursor to a pointing hand when hovering over this item."""
         self.addCursorRect_cursor_(self.bounds(), NSCursor.pointingHandCursor())
 
     def set_selected(self, selected: bool):
+        # Highlight is drawn by the floating selection view; nothing to redraw here
         self._is_selected = selected
-        self.setNeedsDisplay_(True)
     
-    def set_edit_mode(self, enabled: bool):
-        """Toggle between showing timestamp and delete button."""
+    def set_edit_mode(self, enabled: bool, animate: bool = True):
+        """Toggle between showing timestamp and delete button. Without animate
+        (rows scrolled out of view) the new state is applied directly."""
         self._is_edit_mode = enabled
+        if enabled:
+            self._ensure_delete_button()
         
-        from AppKit import NSAnimationContext
+        if not animate:
+            self._time_label.setAlphaValue_(0.0 if enabled else 1.0)
+            if self._delete_button is not None:
+                self._delete_button.setAlphaValue_(1.0 if enabled else 0.0)
+            return
         
         NSAnimationContext.beginGrouping()
         NSAnimationContext.currentContext().setDuration_(0.2)
@@ -259,7 +351,8 @@ class ClipboardItemView(NSView):
             self._delete_button.animator().setAlphaValue_(1.0)
         else:
             self._time_label.animator().setAlphaValue_(1.0)
-            self._delete_button.animator().setAlphaValue_(0.0)
+            if self._delete_button is not None:
+                self._delete_button.animator().setAlphaValue_(0.0)
             
         NSAnimationContext.endGrouping()
     
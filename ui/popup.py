@@ -3,10 +3,13 @@ ClipboardPopup - The main clipboard history popup window.
 A borderless, floating panel with glassmorphism effect.
 """
 
+import logging
 from typing import List, Callable, Optional
 
 from AppKit import (
     NSPanel,
+    NSOperationQueue,
+    NSScrollView,
     NSView,
     NSColor,
     NSVisualEffectView,
@@ -16,50 +19,81 @@ from AppKit import (
     NSPasteboard,
     NSPasteboardTypeString,
     NSPasteboardTypePNG,
+    NSData,
     NSWindowCollectionBehaviorCanJoinAllSpaces,
     NSWindowCollectionBehaviorFullScreenAuxiliary,
     NSScreenSaverWindowLevel,
-    NSEvent,
     NSAnimationContext,
     NSTimer,
+    NSRunLoop,
+    NSRunLoopCommonModes,
     NSMakeRect,
-    NSMakePoint
+    NSMakePoint,
+    NSIntersectsRect,
+    NSObject,
+    NSTrackingArea,
+    NSTrackingMouseEnteredAndExited,
+    NSTrackingMouseMoved,
+    NSTrackingActiveAlways,
+    NSTrackingInVisibleRect
 )
 import objc
 
 from clipboard_monitor import ClipboardItem
-from .constants import POPUP_WIDTH, POPUP_MAX_HEIGHT, ITEM_HEIGHT, PADDING, CORNER_RADIUS, EDIT_BUTTON_HEIGHT
+from .constants import (
+    POPUP_WIDTH, POPUP_MAX_HEIGHT, ITEM_HEIGHT, PADDING, CORNER_RADIUS, EDIT_BUTTON_HEIGHT, MAX_POPUP_ITEMS,
+    ITEM_VIEW_POOL_SIZE, EDIT_BUTTON_SPACE
+)
 from .item_view import ClipboardItemView
 from .edit_button_view import EditButtonView
-from .animations import PopupAnimationMixin
+from .animations import PopupAnimationMixin, _CONTENT_HEIGHTS, _VISIBLE_HEIGHTS
 from .focus_manager import FocusManager
 
+logger = logging.getLogger(__name__)
+
+# Delay between confirming an item and refocusing the original app to paste
+# into it. The popup's hide animation (see HIDE_DURATION) runs concurrently.
+PASTE_REFOCUS_DELAY = 0.05
+
+# Byte value -> grey level in 100..156 for the grain texture
+_NOISE_GREY_TABLE = bytes(100 + (i * 57 >> 8) for i in range(256))
+
+
+def _same_items(a: List[ClipboardItem], b: List[ClipboardItem]) -> bool:
+    """True if both lists hold the very same item objects in the same order."""
+    return len(a) == len(b) and all(x is y for x, y in zip(a, b))
+
+
+class _RowHoverTracker(NSObject):
+    """
+    Owner of the items container's single tracking area.
+    Forwards mouse motion to the popup, which maps it to a row, so rows
+    don't each need a tracking area of their own.
+    """
+
+    def initWithCallback_(self, callback):
+        self = objc.super(_RowHoverTracker, self).init()
+        if self is None:
+            return None
+        self._callback = callback
+        return self
+
+    def mouseEntered_(self, event):
+        self._callback(event)
+
+    def mouseMoved_(self, event):
+        self._callback(event)
+
+    def mouseExited_(self, event):
+        self._callback(None)
+
+
 class ClipboardPopup(NSPanel, PopupAnimationMixin):
     """
     The main clipboard history popup window.
     A borderless, floating panel with glassmorphism effect.
     """
     
-    def _setup_click_outside_monitor(self):
-        """Set up a global monitor to detect clicks outside the popup."""
-        if hasattr(self, '_click_monitor') and self._click_monitor:
-            return
-
-        def handle_click(event):
-            # If we are visible and click is outside our frame
-            if self._is_visible:
-                # content_rect = self.contentView().frame()
-                # If the event window is not us, hide
-                if event.window() != self:
-                    self.hide()
-                return event
-        
-        # Monitor global mouse clicks
-        self._click_monitor = NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
-            1 << 0 | 1 << 1, # LeftMouseDown | LeftMouseUp
-            handle_click
-        )
-
     @classmethod
     def create(cls, on_select: Optional[Callable[[ClipboardItem], None]] = None):
         try:
@@ -74,16 +108,32 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
             # Initialize state
             panel._items = []
             panel._item_views = []
+            panel._rebuild_generation = 0
             panel._edit_button_view = None
             panel._is_visible = False
             panel._on_select = on_select
             panel._on_delete = None
             panel._selected_index = 0
+            panel._selected_view = None
             panel._is_edit_mode = False
+            panel._last_hover_row = None
+            panel._init_deletion_queue()
+            
+            # Animation driver state (see PopupAnimationMixin)
+            panel._hide_generation = 0
+            panel._last_selection_frame = None
+            panel._selection_anim_in_flight = False
+            panel._selection_coalesce_scheduled = False
+            panel._pending_hover_index = None
+            panel._hover_scheduled = False
             
             # Initialize FocusManager
             panel.focus_manager = FocusManager()
             
+            # Serial background queue for the on_delete callback (history save)
+            panel._persist_queue = NSOperationQueue.alloc().init()
+            panel._persist_queue.setMaxConcurrentOperationCount_(1)
+            
             # Configure window
             panel.setLevel_(NSScreenSaverWindowLevel)
             panel.setBackgroundColor_(NSColor.clearColor())
@@ -96,14 +146,14 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
             )
             panel.setAcceptsMouseMovedEvents_(True)
             
-            print("[Popup] Panel configured.", flush=True)
+            logger.debug("[Popup] Panel configured.")
             
             panel._setup_content_view()
-            print("[Popup] Content view created.", flush=True)
+            logger.debug("[Popup] Content view created.")
             
             return panel
         except Exception as e:
-            print(f"[Popup] ERROR creating popup: {e}", flush=True)
+            logger.error("[Popup] ERROR creating popup: %s", e)
             import traceback
             traceback.print_exc()
             raise
@@ -113,7 +163,7 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
     
     def _create_noise_texture(self, width, height):
         """Create a grey noise texture image for grain effect."""
-        import random
+        import os
         from Quartz import (
             CGBitmapContextCreate, CGBitmapContextCreateImage,
             CGColorSpaceCreateDeviceGray, kCGImageAlphaNone
@@ -122,11 +172,10 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
         width = max(width, 64)
         height = max(height, 64)
         
-        # Create greyscale pixel data with random noise
-        pixels = bytearray(width * height)
-        for i in range(len(pixels)):
-            # Random grey values between 100-156 (subtle light/dark grey variation)
-            pixels[i] = random.randint(100, 156)
+        # Create greyscale pixel data with random noise: map random bytes onto
+        # grey values between 100-156 (subtle light/dark grey variation) in one
+        # C-level pass instead of a Python call per pixel
+        pixels = bytearray(os.urandom(width * height).translate(_NOISE_GREY_TABLE))
         
         # Create CGImage from pixel data
         colorspace = CGColorSpaceCreateDeviceGray()
@@ -173,14 +222,35 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
                     grain_layer.setContentsGravity_("resize")
                     grain_layer.setOpacity_(0.15)  # Adjust grain intensity
             except Exception as e:
-                print(f"[GlassEffect] Noise texture error: {e}", flush=True)
+                logger.warning("[GlassEffect] Noise texture error: %s", e)
         self._blur_view.addSubview_(self._grain_view)
         
-        # Container for items
+        # Scroll view and items container, kept for the popup's lifetime;
+        # rebuilds only resize them
+        self._scroll_view = NSScrollView.alloc().initWithFrame_(content_frame)
+        self._scroll_view.setHasVerticalScroller_(True)
+        self._scroll_view.setHasHorizontalScroller_(False)
+        self._scroll_view.setAutohidesScrollers_(True)
+        self._scroll_view.setDrawsBackground_(False)
+        self._scroll_view.setBorderType_(0)
+        self._scroll_view.setScrollerStyle_(1)
+        self._blur_view.addSubview_(self._scroll_view)
+        
         self._items_container = NSView.alloc().initWithFrame_(content_frame)
-        self._items_container.setAutoresizingMask_(18)
         self._items_container.setWantsLayer_(True)
-        self._blur_view.addSubview_(self._items_container)
+        self._scroll_view.setDocumentView_(self._items_container)
+        
+        # One tracking area for all rows (see _on_items_mouse_moved); it
+        # follows the visible rect, so it survives container resizes
+        self._row_hover_tracker = _RowHoverTracker.alloc().initWithCallback_(self._on_items_mouse_moved)
+        self._items_container.addTrackingArea_(
+            NSTrackingArea.alloc().initWithRect_options_owner_userInfo_(
+                self._items_container.bounds(),
+                NSTrackingMouseEnteredAndExited | NSTrackingMouseMoved |
+                NSTrackingActiveAlways | NSTrackingInVisibleRect,
+                self._row_hover_tracker, None
+            )
+        )
         
         # Selection Highlight View
         self._selection_view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, 0, 0))
@@ -197,32 +267,120 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
             layer.setShadowOpacity_(0.2)
             layer.setShadowOffset_(NSMakePoint(0, -2))
             layer.setShadowRadius_(4)
+            # The pill only changes position while navigating: cache fill and
+            # shadow as one bitmap instead of re-rendering the shadow each frame
+            layer.setShouldRasterize_(True)
         
         self._items_container.addSubview_(self._selection_view)
     
     def update_items(self, items: List[ClipboardItem]):
         """Update the displayed clipboard items."""
-        self._items = items[:50]
+        new_items = items[:MAX_POPUP_ITEMS]
+        self._ensure_all_item_views()
+        old_items = self._items
+        
+        # Patch the existing rows in place for the common cases (nothing new, or
+        # one copy on top); anything else, or a popup left mid-edit, rebuilds
+        can_patch = (
+            old_items and len(self._item_views) == len(old_items)
+            and not self._is_edit_mode
+            and not self._deletion_in_progress and not self._deletion_queue
+        )
+        if can_patch and _same_items(new_items, old_items):
+            self._items = new_items
+            self._reset_to_first_item()
+            return
+        if (can_patch and len(new_items) in (len(old_items), len(old_items) + 1)
+                and _same_items(new_items[1:], old_items[:len(new_items) - 1])):
+            self._items = new_items
+            self._prepend_item_view()
+            self._reset_to_first_item()
+            return
+        
+        self._items = new_items
         self._selected_index = 0
         self._rebuild_item_views()
     
+    def _prepend_item_view(self):
+        """Add a row for the new first item and shift the others down a slot,
+        dropping the last row if the list was already full."""
+        if len(self._item_views) == len(self._items):
+            self._recycle_item_view(self._item_views.pop())
+        
+        num_items = len(self._items)
+        total_content_height = _CONTENT_HEIGHTS[num_items]
+        
+        # The popup is hidden between shows, so frames are set directly
+        frame = self.frame()
+        frame.size.height = _VISIBLE_HEIGHTS[num_items]
+        self.setFrame_display_(frame, False)
+        blur_bounds = self.contentView().bounds()
+        self._blur_view.setFrame_(blur_bounds)
+        self._scroll_view.setFrame_(blur_bounds)
+        self._items_container.setFrameSize_((blur_bounds.size.width, total_content_height))
+        
+        edit_origin = self._edit_button_view.frame().origin
+        self._edit_button_view.setFrameOrigin_(
+            (edit_origin.x, total_content_height - PADDING - EDIT_BUTTON_HEIGHT)
+        )
+        
+        inner_width = blur_bounds.size.width - (PADDING * 2)
+        view = self._dequeue_item_view(self._items[0], 1, inner_width)
+        self._items_container.addSubview_(view)
+        self._item_views.insert(0, view)
+        
+        y = total_content_height - PADDING - EDIT_BUTTON_SPACE
+        for i, row in enumerate(self._item_views):
+            y -= ITEM_HEIGHT
+            row._index = i + 1
+            row.setFrame_(NSMakeRect(PADDING, y, inner_width, ITEM_HEIGHT))
+    
+    def _reset_to_first_item(self):
+        """Restore the just-built selection state (first item selected, scrolled
+        to top) on rows that are being kept."""
+        self._edit_button_view.reset_state()
+        self._set_selection(1)
+        self._last_hover_row = None
+        
+        first_frame = self._item_views[0].frame()
+        self._selection_view.setFrame_(first_frame)
+        self._selection_view.setHidden_(False)
+        self._last_selection_frame = None
+        self._selection_anim_in_flight = False
+        self._scroll_to_item(1)
+    
     def _rebuild_item_views(self):
         """Rebuild the item views list."""
-        from AppKit import NSScrollView
-        
-        # Clear old views
+        # Clear old views (back into the pool for the rebuild below)
         for view in self._item_views:
-            view.removeFromSuperview()
+            self._recycle_item_view(view)
         self._item_views.clear()
         
-        # Remove old edit button if exists
-        if self._edit_button_view:
-            self._edit_button_view.removeFromSuperview()
+        # Detach the old edit button; it is re-added to the new container below
+        spare_edit_button = self._edit_button_view
+        if spare_edit_button:
+            spare_edit_button.removeFromSuperviewWithoutNeedingDisplay()
             self._edit_button_view = None
+        self._selected_view = None
+        
+        # The container is reused, so drop anything else left in it (move
+        # groups of a deletion animation whose cleanup was retired below)
+        for subview in list(self._items_container.subviews()):
+            if subview is not self._selection_view:
+                subview.removeFromSuperviewWithoutNeedingDisplay()
         
         # Reset edit mode on rebuild
         self._is_edit_mode = False
         
+        # A deletion cut short by re-showing the popup refers to the old views
+        # (whose pooled views may be re-bound below), so retire its cleanup
+        self._rebuild_generation += 1
+        self._deletion_in_progress = False
+        self._deletion_queue.clear()
+        self._pending_deletion_views.clear()
+        self._removing_views.clear()
+        self._last_hover_row = None
+        
         if not self._items:
             return
         
@@ -242,78 +400,84 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
         blur_bounds = self.contentView().bounds()
         self._blur_view.setFrame_(blur_bounds)
         
-        # Set up scroll view
-        if not hasattr(self, '_scroll_view') or self._scroll_view is None:
-            self._scroll_view = NSScrollView.alloc().initWithFrame_(blur_bounds)
-            self._scroll_view.setHasVerticalScroller_(True)
-            self._scroll_view.setHasHorizontalScroller_(False)
-            self._scroll_view.setAutohidesScrollers_(True)
-            self._scroll_view.setDrawsBackground_(False)
-            self._scroll_view.setBorderType_(0)
-            self._scroll_view.setScrollerStyle_(1)
-            self._blur_view.addSubview_(self._scroll_view)
-        
         self._scroll_view.setFrame_(blur_bounds)
-        
-        self._items_container = NSView.alloc().initWithFrame_(
+        self._items_container.setFrame_(
             NSMakeRect(0, 0, blur_bounds.size.width, total_content_height)
         )
-        self._items_container.setWantsLayer_(True)
-        self._scroll_view.setDocumentView_(self._items_container)
-        
-        # Add selection view to the new container
-        if hasattr(self, '_selection_view'):
-            self._selection_view.removeFromSuperview()
-            self._items_container.addSubview_(self._selection_view)
-            
-            # Position for first clipboard item (index 1, after edit button)
-            if self._items:
-                y = total_content_height - PADDING - edit_button_space - ITEM_HEIGHT
-                start_frame = NSMakeRect(PADDING, y, blur_bounds.size.width - (PADDING * 2), ITEM_HEIGHT)
-                self._selection_view.setFrame_(start_frame)
-                self._selection_view.setHidden_(False)
-            else:
-                self._selection_view.setHidden_(True)
         
-        inner_width = blur_bounds.size.width - (PADDING * 2)
+        # Position for first clipboard item (index 1, after edit button)
+        if self._items:
+            y = total_content_height - PADDING - edit_button_space - ITEM_HEIGHT
+            start_frame = NSMakeRect(PADDING, y, blur_bounds.size.width - (PADDING * 2), ITEM_HEIGHT)
+            self._selection_view.setFrame_(start_frame)
+            self._selection_view.setHidden_(False)
+            self._last_selection_frame = None
+            self._selection_anim_in_flight = False
+        else:
+            self._selection_view.setHidden_(True)
         
         # Create edit button at top-right (index 0)
         edit_btn_width = 64
         edit_btn_x = blur_bounds.size.width - PADDING - edit_btn_width
         edit_btn_y = total_content_height - PADDING - EDIT_BUTTON_HEIGHT
         
-        self._edit_button_view = EditButtonView.alloc_with_callbacks(
-            edit_btn_width,
-            on_click=self._toggle_edit_mode,
-            on_hover=self._on_item_hovered,
-            index=0
-        )
+        if spare_edit_button:
+            spare_edit_button.reset_state()
+            self._edit_button_view = spare_edit_button
+        else:
+            self._edit_button_view = EditButtonView.alloc_with_callbacks(
+                edit_btn_width,
+                on_click=self._toggle_edit_mode,
+                on_hover=self._on_item_hovered,
+                index=0
+            )
         self._edit_button_view.setFrame_(NSMakeRect(edit_btn_x, edit_btn_y, edit_btn_width, EDIT_BUTTON_HEIGHT))
         self._items_container.addSubview_(self._edit_button_view)
         
-        # Create item views (indices 1+)
-        for i, item in enumerate(self._items):
-            actual_index = i + 1  # Shift indices by 1 for edit button
-            y = total_content_height - PADDING - edit_button_space - ((i + 1) * ITEM_HEIGHT)
-            view = ClipboardItemView.alloc_with_item(
-                item, actual_index, inner_width, 
-                on_click=self._on_item_clicked,
-                on_hover=self._on_item_hovered,
-                on_delete=self._on_item_delete
-            )
-            view.setFrame_(NSMakeRect(PADDING, y, inner_width, ITEM_HEIGHT))
-            if actual_index == 1:
-                view.set_selected(True)
-            self._items_container.addSubview_(view)
-            self._item_views.append(view)
+        # Create item views (indices 1+). Only the rows that fit in the popup are
+        # needed for its first frame; the rest are added on the next main-queue
+        # turn, or sooner by _ensure_all_item_views if something needs them.
+        first_screenful = int(visible_height // ITEM_HEIGHT) + 2
+        self._add_item_views(min(first_screenful, num_items))
+        if len(self._item_views) < num_items:
+            NSOperationQueue.mainQueue().addOperationWithBlock_(self._ensure_all_item_views)
         
         # Default selection is first clipboard item (index 1)
-        self._selected_index = 1
+        self._set_selection(1)
         
         # Scroll to top
         if self._items:
             self._scroll_to_item(1)
     
+    def _add_item_views(self, stop: int):
+        """Append rows for _items[len(_item_views):stop], laid out top-down in the container."""
+        container_frame = self._items_container.frame()
+        inner_width = container_frame.size.width - (PADDING * 2)
+        rows_top = container_frame.size.height - PADDING - EDIT_BUTTON_SPACE
+        for i in range(len(self._item_views), stop):
+            actual_index = i + 1  # Shift indices by 1 for edit button
+            view = self._dequeue_item_view(self._items[i], actual_index, inner_width)
+            view.setFrame_(NSMakeRect(PADDING, rows_top - actual_index * ITEM_HEIGHT, inner_width, ITEM_HEIGHT))
+            self._items_container.addSubview_(view)
+            self._item_views.append(view)
+    
+    def _ensure_all_item_views(self):
+        """Create any rows still deferred from the last rebuild."""
+        if len(self._item_views) < len(self._items):
+            self._add_item_views(len(self._items))
+    
+    def _dequeue_item_view(self, item: ClipboardItem, index: int, width: float) -> ClipboardItemView:
+        """Get an item view bound to item, reusing a pooled view when available."""
+        return ClipboardItemView.dequeue_with_item(
+            item, index, width,
+            on_click=self._on_item_clicked,
+            on_delete=self._on_item_delete
+        )
+    
+    def _recycle_item_view(self, view: ClipboardItemView):
+        """Detach an item view, keeping it for reuse while its pool has room."""
+        view.enqueue_for_reuse(ITEM_VIEW_POOL_SIZE)
+    
     def show_at_position(self, x: float, y: float, show_above: bool = False):
         """Show the popup at the specified position with animation."""
         actual_x = x - POPUP_WIDTH / 2
@@ -324,9 +488,17 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
         else:
             start_y = actual_y - 10
         
+        # A hide still in flight would order the window out mid-show
+        self._stop_hide_animation()
+        
         self.setFrameOrigin_(NSMakePoint(actual_x, start_y))
         self.setAlphaValue_(0.0)
         
+        # Rasterize the selection pill at the resolution of the screen it is on
+        layer = self._selection_view.layer()
+        if layer:
+            layer.setRasterizationScale_(self.backingScaleFactor())
+        
         app = NSApplication.sharedApplication()
         app.activateIgnoringOtherApps_(True)
         
@@ -334,57 +506,60 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
         self.orderFrontRegardless()
         self._is_visible = True
         
-        self._setup_click_outside_monitor()
-        
         NSAnimationContext.beginGrouping()
         NSAnimationContext.currentContext().setDuration_(0.15)
         self.animator().setFrameOrigin_(NSMakePoint(actual_x, actual_y))
         self.animator().setAlphaValue_(1.0)
         NSAnimationContext.endGrouping()
     
-    def hide(self, refocus: bool = True, animate: bool = True):
-        """Hide the popup with animation."""
+    def hide(self, refocus: bool = True, animate: bool = True, completion=None):
+        """Hide the popup with animation. completion runs once the window is ordered out."""
         if animate:
-            self._animate_hide() # From Mixin
+            self._animate_hide(completion=completion) # From Mixin
         else:
+            self._stop_hide_animation()
             self.orderOut_(None)
             self._is_visible = False
+            if completion is not None:
+                completion()
             
         if refocus:
             self.focus_manager.refocus_original_element()
             self.focus_manager.refocus_original_app()
     
+    def _set_selection(self, index: int):
+        """Select the view at index (0 = edit button, 1+ = items), deselecting
+        the previously selected view through the reference kept to it."""
+        if self._selected_view is not None:
+            self._selected_view.set_selected(False)
+        if index == 0:
+            view = self._edit_button_view
+        elif 1 <= index <= len(self._item_views):
+            view = self._item_views[index - 1]
+        else:
+            view = None
+        if view is not None:
+            view.set_selected(True)
+        self._selected_view = view
+        self._selected_index = index
+    
     def move_selection(self, delta: int):
         """Move selection up or down. Index 0 = edit button, 1+ = items."""
         if not self._item_views:
             return
-        
-        # Deselect current
-        if self._selected_index == 0:
-            if self._edit_button_view:
-                self._edit_button_view.set_selected(False)
-        elif 1 <= self._selected_index <= len(self._item_views):
-            self._item_views[self._selected_index - 1].set_selected(False)
+        self._ensure_all_item_views()
         
         # Calculate new index (0 = edit button, 1 to len(_items) = items)
         max_index = len(self._items)  # Items are 1-indexed now
-        self._selected_index = max(0, min(max_index, self._selected_index + delta))
-        
-        # Select new
-        if self._selected_index == 0:
-            if self._edit_button_view:
-                self._edit_button_view.set_selected(True)
-            self._selection_view.setHidden_(False)
-            self._animate_selection_change() # From Mixin
-        else:
-            self._item_views[self._selected_index - 1].set_selected(True)
-            self._selection_view.setHidden_(False)
-            self._animate_selection_change() # From Mixin
+        self._set_selection(max(0, min(max_index, self._selected_index + delta)))
+        self._selection_view.setHidden_(False)
+        self._animate_selection_change() # From Mixin
+        if self._selected_index != 0:
             self._scroll_to_item(self._selected_index)
     
     def confirm_selection(self):
         """Confirm the current selection - toggle edit mode, delete, or paste."""
-        print(f"[Popup] confirm_selection called, selected_index={self._selected_index}, edit_mode={self._is_edit_mode}", flush=True)
+        logger.debug("[Popup] confirm_selection called, selected_index=%s, edit_mode=%s", self._selected_index, self._is_edit_mode)
         
         # Index 0 = edit button - toggle edit mode
         if self._selected_index == 0:
@@ -400,11 +575,11 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
         # Normal mode - paste the selected item
         item_index = self._selected_index - 1
         if item_index < 0 or item_index >= len(self._items):
-            print("[Popup] No items or invalid index", flush=True)
+            logger.debug("[Popup] No items or invalid index")
             return
         
         item = self._items[item_index]
-        print(f"[Popup] Selected item: {item.preview[:30]}...", flush=True)
+        logger.debug("[Popup] Selected item: %s...", item.preview[:30])
         
         # Put on clipboard
         pasteboard = NSPasteboard.generalPasteboard()
@@ -412,88 +587,99 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
         
         if hasattr(item, 'content_type'):
             if item.content_type == "image" and item.image_data:
-                from AppKit import NSData
                 png_data = NSData.dataWithBytes_length_(item.image_data, len(item.image_data))
                 pasteboard.setData_forType_(png_data, NSPasteboardTypePNG)
-                print("[Popup] Image placed on clipboard", flush=True)
+                logger.debug("[Popup] Image placed on clipboard")
             elif item.content_type == "mixed" and item.image_data and item.text_content:
-                from AppKit import NSData
                 png_data = NSData.dataWithBytes_length_(item.image_data, len(item.image_data))
                 pasteboard.setData_forType_(png_data, NSPasteboardTypePNG)
                 pasteboard.setString_forType_(item.text_content, NSPasteboardTypeString)
-                print("[Popup] Mixed content placed on clipboard", flush=True)
+                logger.debug("[Popup] Mixed content placed on clipboard")
             else:
                 pasteboard.setString_forType_(item.text_content or item.content, NSPasteboardTypeString)
-                print("[Popup] Text placed on clipboard", flush=True)
+                logger.debug("[Popup] Text placed on clipboard")
         else:
             pasteboard.setString_forType_(item.content, NSPasteboardTypeString)
-            print("[Popup] Content placed on clipboard", flush=True)
-        
-        self.hide(refocus=False)
-        
-        if self._on_select:
-            self._on_select(item)
+            logger.debug("[Popup] Content placed on clipboard")
         
-        # Schedule Focus/Paste sequence
+        # Schedule Focus/Paste sequence first, so the refocus overlaps the
+        # hide animation instead of waiting behind it
         def trigger_paste(timer):
              self.focus_manager.perform_paste_sequence()
 
-        NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
-            0.15, False, trigger_paste
+        paste_timer = NSTimer.timerWithTimeInterval_repeats_block_(
+            PASTE_REFOCUS_DELAY, False, trigger_paste
         )
+        NSRunLoop.currentRunLoop().addTimer_forMode_(paste_timer, NSRunLoopCommonModes)
+        
+        self.hide(refocus=False)
+        
+        if self._on_select:
+            self._on_select(item)
 
     def _on_item_clicked(self, index: int):
         """Handle click on a clipboard item. Index is 1-based for items."""
-        # Deselect current
-        if self._selected_index == 0:
-            if self._edit_button_view:
-                self._edit_button_view.set_selected(False)
-        elif 1 <= self._selected_index <= len(self._item_views):
-            self._item_views[self._selected_index - 1].set_selected(False)
-        
-        self._selected_index = index
-        
-        # Select new
-        if index == 0:
-            if self._edit_button_view:
-                self._edit_button_view.set_selected(True)
-            self._selection_view.setHidden_(False)
-            self._animate_selection_change()
-        else:
-            self._item_views[index - 1].set_selected(True)
-            self._selection_view.setHidden_(False)
-            self._animate_selection_change()
+        self._set_selection(index)
+        self._selection_view.setHidden_(False)
+        self._animate_selection_change()
         
         self.confirm_selection()
     
-    def _on_item_hovered(self, index: int):
-        """Handle mouse hover on a clipboard item. Index is 0 for edit button, 1+ for items."""
-        if index == self._selected_index:
+    def _on_items_mouse_moved(self, event):
+        """Hover the clipboard item under the mouse, found from the row layout.
+        Only crossing into a different row counts; event is None when the mouse leaves."""
+        if event is None:
+            self._last_hover_row = None
             return
+        container = self._items_container
+        point = container.convertPoint_fromView_(event.locationInWindow(), None)
+        size = container.frame().size
+        rows_top = size.height - PADDING - EDIT_BUTTON_SPACE
+        # Rows span PADDING .. width - PADDING, as laid out in _rebuild_item_views
+        if point.y > rows_top or point.x < PADDING or point.x > size.width - PADDING:
+            self._last_hover_row = None
+            return  # Edit button row (it tracks itself) or a side margin
+        row = int((rows_top - point.y) // ITEM_HEIGHT)
+        if row == self._last_hover_row:
+            return
+        self._last_hover_row = row
+        if row < len(self._item_views):
+            self._on_item_hovered(row + 1)
+    
+    def _on_item_hovered(self, index: int):
+        """Handle mouse hover on a clipboard item. Index is 0 for edit button, 1+ for items.
         
-        # Deselect current
-        if self._selected_index == 0:
-            if self._edit_button_view:
-                self._edit_button_view.set_selected(False)
-        elif 1 <= self._selected_index <= len(self._item_views):
-            self._item_views[self._selected_index - 1].set_selected(False)
+        Hovers are throttled to one per frame: a fast sweep across many rows only
+        selects the row the mouse is over when the frame timer fires.
+        """
+        self._pending_hover_index = index
+        if self._hover_scheduled:
+            return
+        self._hover_scheduled = True
         
-        self._selected_index = index
+        def apply_latest_hover(timer):
+            self._hover_scheduled = False
+            self._apply_hover(self._pending_hover_index)
         
-        # Select new
-        if index == 0:
-            if self._edit_button_view:
-                self._edit_button_view.set_selected(True)
-            self._selection_view.setHidden_(False)
-            self._animate_selection_change()
-        else:
-            self._item_views[index - 1].set_selected(True)
-            self._selection_view.setHidden_(False)
-            self._animate_selection_change()
+        hover_timer = NSTimer.timerWithTimeInterval_repeats_block_(
+            1 / 60, False, apply_latest_hover
+        )
+        NSRunLoop.currentRunLoop().addTimer_forMode_(hover_timer, NSRunLoopCommonModes)
+    
+    def _apply_hover(self, index: int):
+        """Select the hovered item (unthrottled)."""
+        if index == self._selected_index or index > len(self._item_views):
+            return  # Already selected, or a row that a rebuild/deletion has since removed
+        
+        # Hovers already arrive at most once per frame, so the pill is moved
+        # right away instead of through another coalescing hop.
+        self._set_selection(index)
+        self._selection_view.setHidden_(False)
+        self._apply_selection_change()
     
     def _scroll_to_item(self, index: int):
         """Scroll the scroll view to make the item at index visible. Index is 1-based for items."""
-        if not hasattr(self, '_scroll_view') or self._scroll_view is None:
+        if self._scroll_view is None:
             return
         
         content_height = self._items_container.frame().size.height
@@ -559,38 +745,59 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
     def _toggle_edit_mode(self):
         """Toggle edit mode on/off."""
         self._is_edit_mode = not self._is_edit_mode
-        print(f"[Popup] Edit mode: {self._is_edit_mode}", flush=True)
+        logger.debug("[Popup] Edit mode: %s", self._is_edit_mode)
+        self._ensure_all_item_views()
         
         # Update edit button text
         if self._edit_button_view:
             self._edit_button_view.set_edit_mode(self._is_edit_mode)
         
-        # Update all item views
+        # Update all item views; only the rows on screen animate the cross-fade
+        visible_rect = self._scroll_view.documentVisibleRect()
         for view in self._item_views:
-            view.set_edit_mode(self._is_edit_mode)
+            view.set_edit_mode(self._is_edit_mode, animate=NSIntersectsRect(view.frame(), visible_rect))
     
     def _delete_item_at_index(self, item_index: int):
         """Delete an item with animation. item_index is 0-based into _items.
         Uses queue-based system to allow spamming delete while animations are in progress."""
         try:
-            if item_index < 0 or item_index >= len(self._items):
-                print(f"[Popup] Invalid delete index: {item_index}", flush=True)
+            self._ensure_all_item_views()
+            if item_index < 0 or item_index >= len(self._item_views):
+                logger.debug("[Popup] Invalid delete index: %s", item_index)
+                return
+            
+            view = self._deletable_view_at(item_index)
+            if view is None:
+                logger.debug("[Popup] Every row is already being deleted, ignoring index %s", item_index)
                 return
             
-            print(f"[Popup] Queuing deletion for item at index {item_index}", flush=True)
+            logger.debug("[Popup] Queuing deletion for item at index %s", item_index)
             
             # Queue the entire deletion operation - data removal + animation
             # The queue processor will call the callback and delete from _items in sequence
             self._queue_item_deletion(
-                view_index=item_index,
-                on_delete_callback=self._on_delete,
+                view,
+                on_delete_callback=self._persist_deletion if self._on_delete else None,
                 item_index=item_index
             )
         except Exception as e:
-            print(f"[Popup] EXCEPTION in _delete_item_at_index: {e}", flush=True)
+            logger.error("[Popup] EXCEPTION in _delete_item_at_index: %s", e)
             import traceback
             traceback.print_exc()
 
+    def _persist_deletion(self, index: int):
+        """Hand a deletion to the owner's on_delete callback off the main thread.
+        The callback gets the ClipboardItem itself: by the time the serial queue
+        runs it, new clips may have shifted the history's indices."""
+        item = self._items[index]
+        on_delete = self._on_delete
+        self._persist_queue.addOperationWithBlock_(lambda: on_delete(item))
+    
+    def wait_for_pending_deletions(self):
+        """Block until queued deletions have reached the owner, so history
+        read afterwards no longer contains deleted items."""
+        self._persist_queue.waitUntilAllOperationsAreFinished()
+    
     def store_focused_element(self, element):
         """Delegate to FocusManager."""
         self.focus_manager.store_focused_element(element)
@@ -621,8 +828,13 @@ class ClipboardPopup(NSPanel, PopupAnimationMixin):
         return False
     
     def resignKeyWindow(self):
-        """Called when the window loses key status."""
+        """Called when the window loses key status.
+        
+        This is the popup's only click-outside detection: clicking another
+        window or app takes key status away. No global event monitor or tap
+        is installed, so clicks elsewhere never reach this process.
+        """
         objc.super(ClipboardPopup, self).resignKeyWindow()
         if self._is_visible:
-            print("[Popup] Lost key window status, hiding with animation...", flush=True)
+            logger.debug("[Popup] Lost key window status, hiding with animation...")
             self._animate_hide()
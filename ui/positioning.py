@@ -2,9 +2,47 @@
 Popup positioning calculations for multi-monitor support.
 """
 
-from AppKit import NSScreen
+import logging
+
+from AppKit import (
+    NSScreen,
+    NSNotificationCenter,
+    NSApplicationDidChangeScreenParametersNotification,
+)
 from accessibility import ElementRect
 
+logger = logging.getLogger(__name__)
+
+# (primary screen height, [(min_x, min_y, max_x, max_y) visible frame per
+# screen, primary first]), read on first use and dropped when the displays change
+_SCREEN_INFO = None
+_SCREEN_OBSERVER = None
+
+
+def _invalidate_screen_info(notification):
+    global _SCREEN_INFO
+    _SCREEN_INFO = None
+
+
+def _screen_info():
+    """Return the cached screen geometry, reading it from NSScreen if needed."""
+    global _SCREEN_INFO, _SCREEN_OBSERVER
+    if _SCREEN_OBSERVER is None:
+        _SCREEN_OBSERVER = NSNotificationCenter.defaultCenter().addObserverForName_object_queue_usingBlock_(
+            NSApplicationDidChangeScreenParametersNotification, None, None, _invalidate_screen_info
+        )
+    if _SCREEN_INFO is None:
+        screens = NSScreen.screens()
+        if not screens:
+            return None  # Not cached: screens may just not be attached yet
+        bounds = []
+        for screen in screens:
+            frame = screen.visibleFrame()
+            min_x, min_y = frame.origin.x, frame.origin.y
+            bounds.append((min_x, min_y, min_x + frame.size.width, min_y + frame.size.height))
+        _SCREEN_INFO = (screens[0].frame().size.height, bounds)
+    return _SCREEN_INFO
+
 
 def calculate_popup_position(element_rect: ElementRect, popup_height: float) -> tuple:
     """
@@ -20,18 +58,16 @@ def calculate_popup_position(element_rect: ElementRect, popup_height: float) ->
     Returns:
         (x, y, show_above) where x,y is the BOTTOM-LEFT corner of popup in Cocoa coords.
     """
-    screens = NSScreen.screens()
-    if not screens:
+    screen_info = _screen_info()
+    if screen_info is None:
         return (100, 100, False)
+    primary_height, visible_bounds = screen_info
         
     # 1. Coordinate System Conversion
     # Cocoa uses a coordinate system where (0,0) is the BOTTOM-LEFT of the PRIMARY screen.
     # Accessibility API (AX) uses (0,0) as the TOP-LEFT of the PRIMARY screen.
     # To convert AX Y to Cocoa Y: CocoaY = PrimaryScreenHeight - AXY
     
-    primary_screen = screens[0]
-    primary_height = primary_screen.frame().size.height
-    
     # Calculate element bounds in Cocoa coordinates
     elem_top_cocoa = primary_height - element_rect.y
     elem_bottom_cocoa = primary_height - (element_rect.y + element_rect.height)
@@ -39,22 +75,17 @@ def calculate_popup_position(element_rect: ElementRect, popup_height: float) ->
     elem_x_cocoa = element_rect.x  # X is same
     elem_center_x = element_rect.center_x
     
-    print(f"[Pos] Element (AX): y={element_rect.y}, h={element_rect.height} -> Cocoa: top={elem_top_cocoa}, bottom={elem_bottom_cocoa}", flush=True)
+    logger.debug("[Pos] Element (AX): y=%s, h=%s -> Cocoa: top=%s, bottom=%s",
+                 element_rect.y, element_rect.height, elem_top_cocoa, elem_bottom_cocoa)
 
     # 2. Find which screen the element is on
-    target_screen = primary_screen
-    
-    for screen in screens:
-        frame = screen.visibleFrame()
-        if (frame.origin.x <= elem_center_x <= frame.origin.x + frame.size.width) and \
-           (frame.origin.y <= elem_bottom_cocoa <= frame.origin.y + frame.size.height):
-            target_screen = screen
-            break
-            
-    screen_frame = target_screen.visibleFrame()
-    screen_min_y = screen_frame.origin.y
-    screen_max_y = screen_frame.origin.y + screen_frame.size.height
-    print(f"[Pos] Target Screen Frame (Visible): {screen_frame}", flush=True)
+    screen_bounds = next(
+        (b for b in visible_bounds
+         if b[0] <= elem_center_x <= b[2] and b[1] <= elem_bottom_cocoa <= b[3]),
+        visible_bounds[0]
+    )
+    _, screen_min_y, _, screen_max_y = screen_bounds
+    logger.debug("[Pos] Target Screen Bounds (Visible): %s", screen_bounds)
 
     # 3. Determine Position
     gap = 6
@@ -75,11 +106,11 @@ def calculate_popup_position(element_rect: ElementRect, popup_height: float) ->
     if fits_below:
         final_y = y_below
         show_above = False
-        print("[Pos] Fits below.", flush=True)
+        logger.debug("[Pos] Fits below.")
     elif fits_above:
         final_y = y_above
         show_above = True
-        print("[Pos] Fits above (below blocked).", flush=True)
+        logger.debug("[Pos] Fits above (below blocked).")
     else:
         # Fits neither? Pick whichever has more space or clamp to screen
         space_below = elem_bottom_cocoa - screen_min_y
@@ -96,5 +127,5 @@ def calculate_popup_position(element_rect: ElementRect, popup_height: float) ->
              if final_y < screen_min_y:
                  final_y = screen_min_y
 
-    print(f"[Pos] Result: y={final_y}, above={show_above}", flush=True)
+    logger.debug("[Pos] Result: y=%s, above=%s", final_y, show_above)
     return (elem_center_x, final_y, show_above)
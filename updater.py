@@ -1,17 +1,121 @@
+import fcntl
+import gzip
+import hashlib
+import http.client
 import json
+import threading
+import time
 import urllib.request
-import urllib.error
 import os
 import tempfile
 import zipfile
+import shlex
 import shutil
+import stat
+import struct
 import subprocess
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from AppKit import NSAlert, NSAlertStyleInformational, NSAlertStyleCritical
 
 import re
 
-RELEASE_URL = "https://api.github.com/repos/sooswastaken/ClipX/releases/tags/latest"
+try:
+    # Optional libdeflate binding; zipfile's zlib path is used without it
+    import deflate
+except ImportError:
+    deflate = None
+
+try:
+    # Optional; parses the API responses straight from bytes
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+API_HOST = "api.github.com"
+RELEASE_PATH = "/repos/sooswastaken/ClipX/releases/tags/latest"
+RELEASE_URL = f"https://{API_HOST}{RELEASE_PATH}"
+# Last release response, revalidated with its ETag / Last-Modified on each check
+UPDATE_LOG_PATH = Path.home() / "Library" / "Logs" / "ClipX" / "update.log"
+RELEASE_CACHE_PATH = Path.home() / "Library" / "Caches" / "ClipX" / "release_etag.json"
+RELEASE_FIELDS = ("tag_name", "published_at", "body", "html_url", "assets")
+# Release notes longer than this are cut before they reach NSAlert
+RELEASE_NOTES_MAX_CHARS = 800
+# Repeat checks within this window are answered without asking the server
+RELEASE_CHECK_TTL = 5 * 60
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+PARALLEL_EXTRACT_MIN_ENTRIES = 8
+# Deflated entries in this size range are inflated with libdeflate, if present.
+# libdeflate needs an entry's compressed and inflated bytes in memory at once,
+# so anything bigger streams through zf.open() instead
+FAST_INFLATE_MIN_SIZE = 64 * 1024
+FAST_INFLATE_MAX_SIZE = 4 * 1024 * 1024
+# Copy size per read when streaming an entry out of the archive
+EXTRACT_COPY_CHUNK_SIZE = 1 << 18
+
+# Run by the install script with the app's interpreter: blocks until the pid
+# in argv[1] exits
+_WAIT_FOR_EXIT_SNIPPET = (
+    "import select, sys; "
+    "kq = select.kqueue(); "
+    "kq.control([select.kevent(int(sys.argv[1]), filter=select.KQ_FILTER_PROC, "
+    "flags=select.KQ_EV_ADD | select.KQ_EV_ENABLE, fflags=select.KQ_NOTE_EXIT)], 0); "
+    "kq.control(None, 1)"
+)
+
+# Run by the install script: atomically exchanges the bundles at argv[1] and
+# argv[2] with renamex_np(RENAME_SWAP). Fails (exit 1) across volumes
+_SWAP_BUNDLES_SNIPPET = (
+    "import ctypes, os, sys; "
+    "libc = ctypes.CDLL(\"/usr/lib/libSystem.dylib\"); "
+    "sys.exit(0 if libc.renamex_np(os.fsencode(sys.argv[1]), os.fsencode(sys.argv[2]), 2) == 0 else 1)"
+)
+
+# One keep-alive connection to the GitHub API, reused across checks so
+# repeat requests skip the TCP + TLS handshake
+_api_connection = None
+_api_lock = threading.Lock()
+
+# Last check_for_updates result as (monotonic ts, local sha, release info),
+# reused for RELEASE_CHECK_TTL seconds. Checks run on background queues, so it
+# is only ever replaced as a whole tuple, never updated field by field.
+_check_memo = None
+
+
+def _api_get(path, headers=None):
+    """
+    GET `path` from the GitHub API over the shared keep-alive connection,
+    asking for gzip. Returns (status, response headers, decoded body bytes).
+    """
+    global _api_connection
+    request_headers = {
+        'Accept-Encoding': 'gzip',
+        'User-Agent': 'ClipX-Updater',
+    }
+    request_headers.update(headers or {})
+    with _api_lock:
+        while True:
+            reused = _api_connection is not None
+            if not reused:
+                _api_connection = http.client.HTTPSConnection(API_HOST, timeout=10)
+            try:
+                _api_connection.request('GET', path, headers=request_headers)
+                response = _api_connection.getresponse()
+                body = response.read()
+                break
+            except (http.client.HTTPException, OSError):
+                _api_connection.close()
+                _api_connection = None
+                # A reused socket may have been dropped while idle; retry
+                # once on a fresh connection
+                if not reused:
+                    raise
+        if response.will_close:
+            _api_connection.close()
+            _api_connection = None
+    if response.getheader('Content-Encoding') == 'gzip':
+        body = gzip.decompress(body)
+    return response.status, response.headers, body
 
 class Updater:
     @staticmethod
@@ -43,84 +147,309 @@ class Updater:
         Fetch the list of commits between local_sha and remote_sha.
         """
         try:
-            url = f"https://api.github.com/repos/sooswastaken/ClipX/compare/{local_sha}...{remote_sha}"
-            print(f"[Updater] Fetching changelog from {url}...")
-            with urllib.request.urlopen(url, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    return data.get("commits", [])
+            path = f"/repos/sooswastaken/ClipX/compare/{local_sha}...{remote_sha}"
+            print(f"[Updater] Fetching changelog from https://{API_HOST}{path}...")
+            status, _, body = _api_get(path)
+            if status == 200:
+                data = json_loads(body)
+                return data.get("commits", [])
         except Exception as e:
             print(f"[Updater] Error fetching changelog: {e}")
             return []
         return []
 
+    @staticmethod
+    def _load_release_cache():
+        """
+        Read the cached release response (etag, last_modified, release).
+        Returns None if there is no usable cache.
+        """
+        try:
+            with open(RELEASE_CACHE_PATH, 'r') as f:
+                cache = json.load(f)
+            if isinstance(cache, dict) and isinstance(cache.get("release"), dict):
+                return cache
+        except (OSError, ValueError):
+            pass
+        return None
+
+    @staticmethod
+    def _save_release_cache(cache):
+        """Write the release cache atomically (temp file + os.replace)."""
+        try:
+            RELEASE_CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = RELEASE_CACHE_PATH.with_suffix(".tmp")
+            with open(tmp_path, 'w') as f:
+                json.dump(cache, f)
+            os.replace(tmp_path, RELEASE_CACHE_PATH)
+        except OSError as e:
+            print(f"[Updater] Could not write release cache: {e}")
+
+    @staticmethod
+    def _fetch_release():
+        """
+        Fetch the latest release JSON, revalidating the cached copy with
+        If-None-Match / If-Modified-Since so an unchanged release costs a bare 304.
+        (A HEAD pre-flight wouldn't be cheaper: the 304 is already headers-only
+        and never reaches json.loads, and a changed release would pay for an
+        extra round trip.)
+        A cache written less than RELEASE_CHECK_TTL ago is returned without
+        any request (survives restarts via the cache file's mtime).
+        Returns the release fields we use, or None if failed.
+        """
+        cache = Updater._load_release_cache()
+        release = Updater._fresh_cached_release(cache)
+        if release is not None:
+            return release
+        
+        status, response_headers, body = _api_get(RELEASE_PATH, Updater._release_request_headers(cache))
+        return Updater._handle_release_response(status, response_headers, body, cache)
+
+    @staticmethod
+    def _fresh_cached_release(cache):
+        """Return the cached release if it was fetched within RELEASE_CHECK_TTL."""
+        if not cache:
+            return None
+        try:
+            age = time.time() - os.stat(RELEASE_CACHE_PATH).st_mtime
+        except OSError:
+            return None
+        if 0 <= age < RELEASE_CHECK_TTL:
+            print("[Updater] Release info checked recently, using cached copy.")
+            return cache["release"]
+        return None
+
+    @staticmethod
+    def _release_request_headers(cache):
+        """Request headers for the release lookup, conditional on the cache."""
+        headers = {'Accept': 'application/vnd.github+json'}
+        if cache:
+            if cache.get("etag"):
+                headers['If-None-Match'] = cache["etag"]
+            if cache.get("last_modified"):
+                headers['If-Modified-Since'] = cache["last_modified"]
+        return headers
+
+    @staticmethod
+    def _handle_release_response(status, response_headers, body, cache):
+        """
+        Turn the release lookup response into the release fields we use,
+        refreshing the cache. Returns None if failed.
+        """
+        if status == 304 and cache:
+            print("[Updater] Release unchanged (304), using cached release info.")
+            try:
+                # Restart the TTL window
+                os.utime(RELEASE_CACHE_PATH)
+            except OSError:
+                pass
+            return cache["release"]
+        if status != 200:
+            print(f"[Updater] Release lookup failed: HTTP {status}")
+            return None
+        data = json_loads(body)
+        # Keep only what check_for_updates reads
+        release = {key: data.get(key) for key in RELEASE_FIELDS}
+        Updater._save_release_cache({
+            "etag": response_headers.get('ETag'),
+            "last_modified": response_headers.get('Last-Modified'),
+            "release": release,
+        })
+        return release
+
     @staticmethod
     def check_for_updates():
         """
         Check GitHub for the latest release.
         Returns a dictionary with release info or None if failed.
+        This blocks for the network round trips; the menu uses
+        check_for_updates_async instead.
         """
         try:
             print(f"[Updater] Checking for updates from {RELEASE_URL}...")
             
-            local_version = Updater.get_local_version()
-            local_sha = local_version.get('commit_sha') if local_version else None
+            local_sha = Updater._local_sha()
+            release_info = Updater._memoized_check(local_sha)
+            if release_info is not None:
+                return release_info
             
-            with urllib.request.urlopen(RELEASE_URL, timeout=10) as response:
-                if response.status == 200:
-                    data = json.loads(response.read().decode('utf-8'))
-                    
-                    # Extract relevant info
-                    release_info = {
-                        "tag_name": data.get("tag_name"),
-                        "published_at": data.get("published_at"),
-                        "body": data.get("body"),
-                        "html_url": data.get("html_url"),
-                        "assets": data.get("assets", []),
-                        "status": "UNKNOWN",
-                        "changelog": []
-                    }
-                    
-                    # Find the asset download URL
-                    for asset in release_info["assets"]:
-                        if asset["name"] == "ClipX.zip":
-                            release_info["download_url"] = asset["browser_download_url"]
-                            break
-                    
-                    # Try to parse SHA from release body
-                    # Look for "Commit: <sha>"
-                    remote_sha = None
-                    if release_info.get('body'):
-                        match = re.search(r'Commit: ([a-f0-9]+)', release_info['body'])
-                        if match:
-                            remote_sha = match.group(1)
-                            release_info["remote_sha"] = remote_sha
-                    
-                    # Compare versions
-                    if local_sha and remote_sha:
-                        # Simple prefix matching (GH usually gives short SHA or long SHA)
-                        # Normalize to verify equality
-                        if remote_sha.startswith(local_sha) or local_sha.startswith(remote_sha):
-                            release_info["status"] = "UP_TO_DATE"
-                        else:
-                            release_info["status"] = "UPDATE_AVAILABLE"
-                            # Fetch changelog
-                            commits = Updater.get_compare_data(local_sha, remote_sha)
-                            # Extract clean messages (first line)
-                            release_info["changelog"] = [c['commit']['message'].split('\n')[0] for c in commits]
-                            
-                    elif not local_sha:
-                        # No local version info (dev mode or old build), assume update available ??
-                        # Or maybe UNKNOWN. Let's say UNKNOWN but available to download.
-                        print("[Updater] No local version info found.")
-                        release_info["status"] = "UNKNOWN"
-                    
-                    return release_info
+            return Updater._build_release_info(Updater._fetch_release(), local_sha)
         except Exception as e:
             print(f"[Updater] Error checking for updates: {e}")
             return None
+
+    @staticmethod
+    def check_for_updates_async(callback):
+        """
+        Same as check_for_updates without blocking the caller: the release
+        lookup runs as an NSURLSession data task on the system network queue,
+        and callback(release_info) is invoked on the main queue (release_info
+        is None if the check failed).
+        """
+        from Foundation import (
+            NSURL,
+            NSMutableURLRequest,
+            NSURLRequestReloadIgnoringLocalCacheData,
+            NSURLSession,
+        )
+        from libdispatch import (
+            dispatch_async,
+            dispatch_get_global_queue,
+            dispatch_get_main_queue,
+            DISPATCH_QUEUE_PRIORITY_DEFAULT,
+        )
+        
+        print(f"[Updater] Checking for updates from {RELEASE_URL}...")
+        
+        def deliver(release_info):
+            dispatch_async(dispatch_get_main_queue(), lambda: callback(release_info))
+        
+        def finish(fetch, local_sha):
+            # Runs off the main thread; the changelog lookup may still block here
+            try:
+                release_info = Updater._build_release_info(fetch(), local_sha)
+            except Exception as e:
+                print(f"[Updater] Error checking for updates: {e}")
+                release_info = None
+            deliver(release_info)
+        
+        def start():
+            # Runs on a global queue: the version file and release cache reads
+            # stay off the main thread too
+            try:
+                local_sha = Updater._local_sha()
+                release_info = Updater._memoized_check(local_sha)
+                if release_info is not None:
+                    deliver(release_info)
+                    return
+                
+                cache = Updater._load_release_cache()
+                release = Updater._fresh_cached_release(cache)
+                if release is not None:
+                    finish(lambda: release, local_sha)
+                    return
+                
+                request = NSMutableURLRequest.requestWithURL_(NSURL.URLWithString_(RELEASE_URL))
+                # Let our If-None-Match / If-Modified-Since through and get the 304 back
+                request.setCachePolicy_(NSURLRequestReloadIgnoringLocalCacheData)
+                for name, value in Updater._release_request_headers(cache).items():
+                    request.setValue_forHTTPHeaderField_(value, name)
+            except Exception as e:
+                print(f"[Updater] Error checking for updates: {e}")
+                deliver(None)
+                return
+            
+            def completion(data, response, error):
+                if error is not None:
+                    print(f"[Updater] Error checking for updates: {error.localizedDescription()}")
+                    deliver(None)
+                    return
+                response_headers = {
+                    name: response.valueForHTTPHeaderField_(name)
+                    for name in ('ETag', 'Last-Modified')
+                }
+                body = bytes(data) if data is not None else b""
+                finish(lambda: Updater._handle_release_response(
+                    response.statusCode(), response_headers, body, cache
+                ), local_sha)
+            
+            NSURLSession.sharedSession().dataTaskWithRequest_completionHandler_(request, completion).resume()
+        
+        dispatch_async(dispatch_get_global_queue(DISPATCH_QUEUE_PRIORITY_DEFAULT, 0), start)
+
+    @staticmethod
+    def _local_sha():
+        """Commit sha of the running build, or None if unknown."""
+        local_version = Updater.get_local_version()
+        return local_version.get('commit_sha') if local_version else None
+
+    @staticmethod
+    def _memoized_check(local_sha):
+        """The last check result, if it is for this build and within the TTL."""
+        memo = _check_memo
+        if memo is None:
+            return None
+        ts, memo_sha, release_info = memo
+        if memo_sha == local_sha and time.monotonic() - ts < RELEASE_CHECK_TTL:
+            return release_info
         return None
 
+    @staticmethod
+    def _build_release_info(data, local_sha):
+        """
+        Build the release info dict from the release fields (status, changelog,
+        download URL, checksum). Returns None if data is None.
+        """
+        if data is None:
+            return None
+        
+        # Extract relevant info
+        release_info = {
+            "tag_name": data.get("tag_name"),
+            "published_at": data.get("published_at"),
+            "body": data.get("body"),
+            "html_url": data.get("html_url"),
+            "assets": data.get("assets") or [],
+            "status": "UNKNOWN",
+            "changelog": []
+        }
+        
+        # Find the asset download URL. Only the full ClipX.zip is published:
+        # the release workflow rebuilds a single "latest" release per commit
+        # and deletes the previous one, so there is no earlier build to
+        # diff a delta patch against.
+        for asset in release_info["assets"]:
+            if asset["name"] == "ClipX.zip":
+                release_info["download_url"] = asset["browser_download_url"]
+                # GitHub publishes "sha256:<hex>" for newer uploads
+                digest = asset.get("digest") or ""
+                if digest.startswith("sha256:"):
+                    release_info["sha256"] = digest[len("sha256:"):]
+                break
+        
+        # Try to parse SHA from release body
+        # Look for "Commit: <sha>"
+        remote_sha = None
+        if release_info.get('body'):
+            match = re.search(r'Commit: ([a-f0-9]+)', release_info['body'])
+            if match:
+                remote_sha = match.group(1)
+                release_info["remote_sha"] = remote_sha
+            # Look for "SHA256: <hex>" of ClipX.zip
+            match = re.search(r'SHA256: ([a-f0-9]{64})', release_info['body'])
+            if match and "sha256" not in release_info:
+                release_info["sha256"] = match.group(1)
+        
+        # Pre-cut the notes shown in the dialog so NSAlert never lays out a
+        # huge body on the main thread
+        body = release_info.get('body') or ""
+        if len(body) > RELEASE_NOTES_MAX_CHARS:
+            body = body[:RELEASE_NOTES_MAX_CHARS].rstrip() + "…"
+        release_info["display_body"] = body
+        
+        # Compare versions
+        if local_sha and remote_sha:
+            # Simple prefix matching (GH usually gives short SHA or long SHA)
+            # Normalize to verify equality
+            if remote_sha.startswith(local_sha) or local_sha.startswith(remote_sha):
+                release_info["status"] = "UP_TO_DATE"
+            else:
+                release_info["status"] = "UPDATE_AVAILABLE"
+                # Fetch changelog
+                commits = Updater.get_compare_data(local_sha, remote_sha)
+                # Extract clean messages (first line)
+                release_info["changelog"] = [c['commit']['message'].split('\n')[0] for c in commits]
+                
+        elif not local_sha:
+            # No local version info (dev mode or old build), assume update available ??
+            # Or maybe UNKNOWN. Let's say UNKNOWN but available to download.
+            print("[Updater] No local version info found.")
+            release_info["status"] = "UNKNOWN"
+        
+        global _check_memo
+        _check_memo = (time.monotonic(), local_sha, release_info)
+        return release_info
+
     @staticmethod
     def download_and_install(download_url):
         # ... existing download code ...
@@ -139,6 +468,8 @@ class Updater:
         Show a dialog to the user about the update.
         Returns True if user wants to update, False otherwise.
         """
+        from AppKit import NSAlert, NSAlertStyleCritical
+        
         alert = NSAlert.alloc().init()
         
         if release_info:
@@ -188,7 +519,7 @@ class Updater:
                 info_text = (
                     f"Latest Release: {tag_name}\n"
                     f"Published: {published_date}\n\n"
-                    f"Release Notes:\n{release_info.get('body')}\n\n"
+                    f"Release Notes:\n{release_info.get('display_body')}\n\n"
                     "Would you like to download this update?"
                 )
                 alert.setInformativeText_(info_text)
@@ -210,9 +541,29 @@ class Updater:
     def _create_install_script(old_app_path, new_app_path, pid):
         """
         Create a shell script to swap the apps and restart.
+        Its output is appended to UPDATE_LOG_PATH, so the path it took (kqueue
+        wait or polling, atomic swap or remove + move) is on record.
         """
+        python_path = os.pathsep.join(p for p in sys.path if p)
         script_content = f"""#!/bin/bash
-# Wait for the old app to terminate
+mkdir -p {shlex.quote(str(UPDATE_LOG_PATH.parent))}
+exec >> {shlex.quote(str(UPDATE_LOG_PATH))} 2>&1
+echo "--- ClipX update $(date) ---"
+
+# The app's embedded interpreter is started outside the app bootstrap, so
+# point it at its stdlib explicitly
+clipx_python() {{
+    PYTHONHOME={shlex.quote(sys.prefix)} PYTHONPATH={shlex.quote(python_path)} {shlex.quote(sys.executable)} "$@"
+}}
+
+# Wait for the old app to terminate: block on a kqueue NOTE_EXIT event for
+# its pid (no wakeups until it exits). If the interpreter can't run, or the
+# app is already gone, the polling loop below takes over / falls through.
+if clipx_python -c {shlex.quote(_WAIT_FOR_EXIT_SNIPPET)} {pid}; then
+    echo "App exited (kqueue NOTE_EXIT)"
+else
+    echo "kqueue wait failed, polling for pid {pid}"
+fi
 while kill -0 {pid} 2>/dev/null; do
     sleep 0.5
 done
@@ -220,14 +571,26 @@ done
 # Short delay to ensure file locks are released
 sleep 1
 
-# Move new app to old app location
 echo "Replacing {old_app_path} with {new_app_path}"
-rm -rf "{old_app_path}"
-mv "{new_app_path}" "{old_app_path}"
+if clipx_python -c {shlex.quote(_SWAP_BUNDLES_SNIPPET)} "{new_app_path}" "{old_app_path}"; then
+    # Swapped in place: the old bundle now sits at the new app's temp path
+    echo "Swapped bundles atomically (renamex_np RENAME_SWAP)"
+    echo "Relaunching..."
+    open "{old_app_path}" --args --updated
+    rm -rf "{new_app_path}"
+else
+    # Different volume (or no renamex_np): fall back to remove + move
+    echo "Atomic swap failed, replacing with rm -rf + mv"
+    rm -rf "{old_app_path}"
+    mv "{new_app_path}" "{old_app_path}"
+
+    # Relaunch with --updated flag so app knows it was just updated
+    echo "Relaunching..."
+    open "{old_app_path}" --args --updated
+fi
 
-# Relaunch with --updated flag so app knows it was just updated
-echo "Relaunching..."
-open "{old_app_path}" --args --updated
+# Remove the (now empty) staging directory
+rmdir "$(dirname "{new_app_path}")" 2>/dev/null
 
 # Cleanup script
 rm -- "$0"
@@ -240,50 +603,196 @@ rm -- "$0"
         return script_path
 
     @staticmethod
-    def install_and_restart(download_url):
+    def _download_to(url, path):
+        """
+        Stream url into path through one reused 1 MiB buffer: readinto() fills
+        it in place and each chunk is written straight from a memoryview, so no
+        bytes object is allocated per read. The SHA-256 is computed on the same
+        chunks; returns its hex digest.
+        The zip is read back once by the extractor and then deleted, so on macOS
+        the file is written with F_NOCACHE rather than kept in the page cache.
+        """
+        buf = bytearray(DOWNLOAD_CHUNK_SIZE)
+        view = memoryview(buf)
+        digest = hashlib.sha256()
+        with urllib.request.urlopen(url) as response:
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            if hasattr(fcntl, 'F_NOCACHE'):
+                fcntl.fcntl(fd, fcntl.F_NOCACHE, 1)
+            with os.fdopen(fd, 'wb', buffering=DOWNLOAD_CHUNK_SIZE) as out_file:
+                while True:
+                    n = response.readinto(buf)
+                    if not n:
+                        break
+                    digest.update(view[:n])
+                    out_file.write(view[:n])
+        return digest.hexdigest()
+
+    @staticmethod
+    def _extract_member(zf, raw, info, dest_dir):
+        """
+        Extract one file entry of zf; its parent directory must already exist.
+        Mid-sized deflated entries (FAST_INFLATE_MIN_SIZE..FAST_INFLATE_MAX_SIZE)
+        are read raw from `raw` (a separate handle on the same archive) and
+        inflated in a single libdeflate call when the `deflate` package is
+        installed; the rest, including the big binaries, are streamed through
+        zf.open() in 256 KiB reads. Symlinks are recreated as symlinks, and the
+        entry's permission bits and mtime are restored.
+        """
+        name = info.filename
+        if os.path.isabs(name) or '..' in name.split('/'):
+            # Let zipfile sanitise the path
+            zf.extract(info, dest_dir)
+            return
+        
+        dst = f"{dest_dir}/{name}"
+        mode = info.external_attr >> 16
+        if stat.S_ISLNK(mode):
+            os.symlink(zf.read(info).decode('utf-8'), dst)
+            return
+        
+        if (deflate is not None and info.compress_type == zipfile.ZIP_DEFLATED
+                and FAST_INFLATE_MIN_SIZE <= info.file_size <= FAST_INFLATE_MAX_SIZE):
+            # Skip the local file header (its name/extra lengths can differ
+            # from the central directory's) to reach the compressed data
+            raw.seek(info.header_offset)
+            header = raw.read(zipfile.sizeFileHeader)
+            name_len, extra_len = struct.unpack('<HH', header[26:30])
+            raw.seek(name_len + extra_len, os.SEEK_CUR)
+            data = deflate.deflate_decompress(raw.read(info.compress_size), info.file_size)
+            if deflate.crc32(data) != info.CRC:
+                raise zipfile.BadZipFile(f"Bad CRC-32 for file {name!r}")
+            with open(dst, 'wb') as out_file:
+                out_file.write(data)
+        else:
+            with zf.open(info) as src, open(dst, 'wb') as out_file:
+                shutil.copyfileobj(src, out_file, EXTRACT_COPY_CHUNK_SIZE)
+        
+        if mode & 0o777:
+            os.chmod(dst, mode & 0o777)
+        mtime = time.mktime(info.date_time + (0, 0, -1))
+        os.utime(dst, (mtime, mtime))
+
+    @staticmethod
+    def _extract_zip(zip_path, dest_dir):
+        """
+        Extract zip_path into dest_dir, spreading the file entries over a thread
+        pool (zlib releases the GIL while inflating). Small archives are
+        extracted serially.
+        """
+        with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+            infos = zip_ref.infolist()
+            
+            # Split directory entries from files in one pass, and create every
+            # directory (including file parents) up front so workers never race
+            # on makedirs or need an isdir check
+            dirs = set()
+            file_infos = []
+            for info in infos:
+                name = info.filename
+                if name.endswith('/'):
+                    dirs.add(name[:-1])
+                else:
+                    file_infos.append(info)
+                    dirs.add(os.path.dirname(name))
+        
+        makedirs = os.makedirs
+        for name in dirs:
+            if name and not os.path.isabs(name) and '..' not in name.split('/'):
+                makedirs(f"{dest_dir}/{name}", exist_ok=True)
+        
+        # Largest entries first, dealt round-robin below, so no worker is left
+        # inflating one big binary after the others are done
+        file_infos.sort(key=lambda i: i.compress_size, reverse=True)
+        
+        def extract_files(chunk):
+            # Each worker reads through its own handles
+            with zipfile.ZipFile(zip_path, 'r') as zf, open(zip_path, 'rb') as raw:
+                extract = Updater._extract_member
+                for info in chunk:
+                    extract(zf, raw, info, dest_dir)
+        
+        # Directory-only archives have nothing left for a pool to do
+        if len(infos) < PARALLEL_EXTRACT_MIN_ENTRIES or not file_infos:
+            extract_files(file_infos)
+            return
+        
+        workers = min(os.cpu_count() or 1, len(file_infos))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            # list() re-raises the first worker error, if any
+            list(pool.map(extract_files, [file_infos[i::workers] for i in range(workers)]))
+
+    @staticmethod
+    def install_and_restart(download_url, expected_sha256=None):
         """
         Download, extract, and replace the running application.
+        If expected_sha256 is given, a zip that doesn't match is discarded
+        before extraction.
         """
+        temp_dir = None
         try:
             print(f"[Updater] Downloading update from {download_url}...")
             
-            # Create temp directory
-            temp_dir = Path(tempfile.mkdtemp(prefix="ClipX_Update_"))
+            # Detect current app path
+            from AppKit import NSBundle
+            current_bundle_path = NSBundle.mainBundle().bundlePath()
+            
+            # Check if we are running as a packaged app
+            # CRITICAL: Only use sys.frozen to detect packaged app. 
+            # Checking .endswith('.app') is DANGEROUS because when running from source,
+            # the main bundle is often the Python interpreter itself (Python.app).
+            is_packaged = getattr(os.sys, 'frozen', False)
+            
+            # Create temp directory. When packaged, stage it next to the
+            # installed bundle so the install script's swap is a same-volume
+            # rename; fall back to the system temp dir if that isn't writable.
+            if is_packaged:
+                try:
+                    temp_dir = Path(tempfile.mkdtemp(
+                        prefix=".ClipX_Update_", dir=os.path.dirname(current_bundle_path)
+                    ))
+                except OSError as e:
+                    print(f"[Updater] Cannot stage next to the app ({e}), using temp dir.")
+            if temp_dir is None:
+                temp_dir = Path(tempfile.mkdtemp(prefix="ClipX_Update_"))
             zip_path = temp_dir / "ClipX.zip"
             
             # Download
-            with urllib.request.urlopen(download_url) as response, open(zip_path, 'wb') as out_file:
-                shutil.copyfileobj(response, out_file)
+            zip_sha256 = Updater._download_to(download_url, zip_path)
+            if expected_sha256:
+                if zip_sha256 != expected_sha256.lower():
+                    print(f"[Updater] Error: checksum mismatch (expected {expected_sha256}, got {zip_sha256})")
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    return False
+                print("[Updater] Checksum verified.")
+            else:
+                print("[Updater] No published checksum, skipping verification.")
             
-            # Extract
+            # Extract. ZipFile needs the central directory at the end of the
+            # archive, so extraction can only start once the download is done;
+            # the zip was written with F_NOCACHE, so this reads it back from disk.
             print("[Updater] Extracting...")
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                zip_ref.extractall(temp_dir)
+            Updater._extract_zip(zip_path, temp_dir)
+            
+            # The app is moved out of temp_dir by the install script; don't
+            # leave the archive behind next to it
+            zip_path.unlink()
             
             new_app_path = temp_dir / "ClipX.app"
             if not new_app_path.exists():
                 print("[Updater] Error: ClipX.app not found in zip")
+                shutil.rmtree(temp_dir, ignore_errors=True)
                 return False
 
-            # FIX: Restore executable permissions
-            # ZipFile extractall doesn't always preserve permissions
+            # Extraction restores the archive's Unix modes; still make sure the
+            # executable bit is set in case the zip was built without them
             executable_path = new_app_path / "Contents" / "MacOS" / "ClipX"
             if executable_path.exists():
-                print(f"[Updater] Restoring executable permissions for {executable_path}")
+                print(f"[Updater] Ensuring executable permissions for {executable_path}")
                 os.chmod(executable_path, 0o755)
             else:
                  print(f"[Updater] Warning: Executable not found at {executable_path}")
 
-            # Detect current app path
-            from AppKit import NSBundle
-            current_bundle_path = NSBundle.mainBundle().bundlePath()
-            
-            # Check if we are running as a packaged app
-            # CRITICAL: Only use sys.frozen to detect packaged app. 
-            # Checking .endswith('.app') is DANGEROUS because when running from source,
-            # the main bundle is often the Python interpreter itself (Python.app).
-            is_packaged = getattr(os.sys, 'frozen', False)
-            
             if is_packaged and current_bundle_path != str(new_app_path):
                 print(f"[Updater] Preparing to replace {current_bundle_path}...")
                 
@@ -295,7 +804,11 @@ rm -- "$0"
                 )
                 
                 print(f"[Updater] Launching update script: {script_path}")
-                subprocess.Popen(['/bin/bash', script_path], start_new_session=True)
+                try:
+                    # posix_spawn skips the fork() copy of this (large) process
+                    os.posix_spawn('/bin/bash', ['/bin/bash', script_path], os.environ, setsid=True)
+                except (AttributeError, NotImplementedError, OSError):
+                    subprocess.Popen(['/bin/bash', script_path], start_new_session=True)
                 
                 # Signal success (caller should exit)
                 return True
@@ -306,6 +819,10 @@ rm -- "$0"
             
         except Exception as e:
             print(f"[Updater] Error installing update: {e}")
+            # The install script never launched; don't leave a partial zip or
+            # half-extracted app in the staging dir (possibly next to the app)
+            if temp_dir is not None:
+                shutil.rmtree(temp_dir, ignore_errors=True)
             return False
 
     @staticmethod
@@ -314,6 +831,8 @@ rm -- "$0"
         Show a dialog to the user about the update.
         Returns True if user wants to update, False otherwise.
         """
+        from AppKit import NSAlert, NSAlertStyleCritical
+        
         alert = NSAlert.alloc().init()
         
         if release_info:
@@ -366,7 +885,7 @@ rm -- "$0"
                 info_text = (
                     f"Latest Release: {tag_name}\n"
                     f"Published: {published_date}\n\n"
-                    f"Release Notes:\n{release_info.get('body')}\n\n"
+                    f"Release Notes:\n{release_info.get('display_body')}\n\n"
                     "Would you like to download this update?"
                 )
                 alert.setInformativeText_(info_text)